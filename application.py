@@ -0,0 +1,743 @@
+import tkinter as tk
+from tkinter import messagebox, simpledialog, filedialog
+from bisect import bisect_left
+from concurrent.futures import Future, ThreadPoolExecutor
+import csv
+import os
+import queue
+import time
+
+from livraison import Camion, Commande, Depot, Livreur, Moto, Repartiteur
+from importation import ImportateurDepot
+from ingestion import ServiceIngestion
+from instrumentation import Instrumentation
+from persistance import JournalDepot
+
+class VirtualListbox(tk.Frame):
+    def __init__(self, master, items, label=str, key=str, height=5, **listbox_options):
+        super().__init__(master, bg=master.cget("bg"))
+        self.items = items
+        self.label = label
+        self.key = key
+        self.height = height
+        self.offset = 0
+        self.selected = None
+        self.sorted_keys = None
+        self.sorted_positions = None
+        self.matches = None
+
+        self.filter_var = tk.StringVar(self)
+        self.filter_var.trace_add("write", self.on_filter)
+        tk.Entry(self, textvariable=self.filter_var, font=listbox_options.get("font")).grid(row=0, column=0, columnspan=2, sticky="ew", pady=(0, 2))
+        self.listbox = tk.Listbox(self, height=height, exportselection=False, **listbox_options)
+        self.listbox.grid(row=1, column=0)
+        self.scrollbar = tk.Scrollbar(self, command=self.on_scroll)
+        self.scrollbar.grid(row=1, column=1, sticky="ns")
+
+        self.listbox.bind("<<ListboxSelect>>", self.on_select)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.listbox.bind(sequence, self.on_wheel)
+        self.render()
+
+    def row_count(self):
+        return len(self.items) if self.matches is None else len(self.matches)
+
+    def row(self, index):
+        return self.items[index] if self.matches is None else self.items[self.matches[index]]
+
+    def selected_item(self):
+        return self.selected
+
+    def render(self):
+        total = self.row_count()
+        self.offset = max(0, min(self.offset, total - self.height))
+        end = min(total, self.offset + self.height)
+        rows = [self.row(index) for index in range(self.offset, end)]
+        self.listbox.delete(0, tk.END)
+        self.listbox.insert(tk.END, *[self.label(item) for item in rows])
+        for index, item in enumerate(rows):
+            if item is self.selected:
+                self.listbox.selection_set(index)
+        if total:
+            self.scrollbar.set(self.offset / total, end / total)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def build_prefix_index(self):
+        keys = self.items.cles() if hasattr(self.items, "cles") else map(self.key, self.items)
+        pairs = sorted((str(key).casefold(), position) for position, key in enumerate(keys))
+        self.sorted_keys = [key for key, _ in pairs]
+        self.sorted_positions = [position for _, position in pairs]
+
+    def on_filter(self, *args):
+        prefix = self.filter_var.get().casefold()
+        if not prefix:
+            self.matches = None
+        else:
+            if self.sorted_keys is None:
+                self.build_prefix_index()
+            low = bisect_left(self.sorted_keys, prefix)
+            high = bisect_left(self.sorted_keys, prefix[:-1] + chr(ord(prefix[-1]) + 1), low)
+            self.matches = self.sorted_positions[low:high]
+        self.offset = 0
+        self.render()
+
+    def on_scroll(self, action, amount, unit=None):
+        if action == "moveto":
+            self.offset = int(float(amount) * self.row_count())
+        else:
+            step = int(amount)
+            self.offset += step * self.height if unit == "pages" else step
+        self.render()
+
+    def on_wheel(self, event):
+        self.on_scroll("scroll", -1 if event.num == 4 or event.delta > 0 else 1, "units")
+        return "break"
+
+    def on_select(self, event):
+        selection = self.listbox.curselection()
+        if selection:
+            self.selected = self.row(self.offset + selection[0])
+
+class BackgroundTasks:
+    POLL_INTERVAL_MS = 30
+    POLL_BUDGET = 0.02
+
+    def __init__(self, master):
+        self.master = master
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.events = queue.SimpleQueue()
+        self.pending = 0
+        self.poll_job = None
+
+    def submit(self, function, on_done, on_error, on_progress=None):
+        self.pending += 1
+        self.executor.submit(self.run, function, on_done, on_error, on_progress)
+        if self.poll_job is None:
+            self.poll_job = self.master.after(self.POLL_INTERVAL_MS, self.poll)
+
+    def run(self, function, on_done, on_error, on_progress):
+        def progress(*args):
+            if on_progress is not None:
+                self.events.put((False, on_progress, args))
+        try:
+            result = function(progress)
+        except Exception as e:
+            self.events.put((True, on_error, (e,)))
+        else:
+            self.events.put((True, on_done, (result,)))
+
+    def poll(self):
+        self.poll_job = None
+        deadline = time.perf_counter() + self.POLL_BUDGET
+        while time.perf_counter() < deadline:
+            try:
+                finished, callback, args = self.events.get_nowait()
+            except queue.Empty:
+                break
+            if finished:
+                self.pending -= 1
+            callback(*args)
+        if self.pending or not self.events.empty():
+            self.poll_job = self.master.after(self.POLL_INTERVAL_MS, self.poll)
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True)
+        if self.poll_job is not None:
+            self.master.after_cancel(self.poll_job)
+            self.poll_job = None
+
+class ReportView(tk.Toplevel):
+    PAGE_SIZE = 500
+
+    def __init__(self, master, title, lines):
+        super().__init__(master)
+        self.title(title)
+        self.config(bg="#F0F8FF")
+        self.lines = lines
+        self.page = 0
+        self.page_count = max(1, -(-len(lines) // self.PAGE_SIZE))
+
+        self.text = tk.Text(self, height=25, width=90, bg="#FFFFFF", fg="#333333", font=("Consolas", 10), bd=2, relief="sunken")
+        self.text.grid(row=0, column=0, columnspan=3, sticky="nsew", padx=(5, 0), pady=5)
+        scrollbar = tk.Scrollbar(self, command=self.text.yview)
+        scrollbar.grid(row=0, column=3, sticky="ns", pady=5)
+        self.text.config(yscrollcommand=scrollbar.set)
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(1, weight=1)
+
+        button_font = ("Helvetica", 10, "bold")
+        self.previous_button = tk.Button(self, text="< Précédent", command=lambda: self.show_page(self.page - 1), font=button_font)
+        self.previous_button.grid(row=1, column=0, padx=5, pady=5)
+        self.page_label = tk.Label(self, bg="#F0F8FF", font=("Helvetica", 10))
+        self.page_label.grid(row=1, column=1, pady=5)
+        self.next_button = tk.Button(self, text="Suivant >", command=lambda: self.show_page(self.page + 1), font=button_font)
+        self.next_button.grid(row=1, column=2, padx=5, pady=5)
+        self.show_page(0)
+
+    def show_page(self, page):
+        self.page = max(0, min(page, self.page_count - 1))
+        start = self.page * self.PAGE_SIZE
+        self.text.config(state='normal')
+        self.text.delete(1.0, tk.END)
+        self.text.insert(tk.END, "\n".join(self.lines[start:start + self.PAGE_SIZE]))
+        self.text.config(state='disabled')
+        self.page_label.config(text=f"Page {self.page + 1}/{self.page_count} ({len(self.lines)} ligne(s))")
+        self.previous_button.config(state='normal' if self.page > 0 else 'disabled')
+        self.next_button.config(state='normal' if self.page < self.page_count - 1 else 'disabled')
+
+class DeliveryApp:
+    FULL_RENDER_THRESHOLD = 2000
+    FULL_RENDER_FRACTION = 0.5
+    EVENT_PUMP_MS = 40
+    MAIN_THREAD_BUDGET = 0.02
+    METRICS_EXPORT_MS = 10000
+
+    def __init__(self, master, depot=None):
+        self.master = master
+        master.title("Système de Simulation d'Entreprise de Livraison")
+        master.geometry("1000x700")
+        master.config(bg="#E0F2F7")
+
+        self.journal = None
+        if depot is None:
+            self.journal = JournalDepot(os.path.join(os.path.dirname(os.path.abspath(__file__)), "donnees"))
+            depot = self.journal.charger()
+        self.depot = depot
+        master.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.status_marks = {}
+        self.next_status_mark = 0
+        self.tasks = BackgroundTasks(master)
+        self.main_thread_calls = queue.SimpleQueue()
+        self.ingestion = None
+        self.buttons = []
+
+        self.main_frame = tk.Frame(master, bg="#E0F2F7", bd=5, relief="groove")
+        self.main_frame.pack(padx=20, pady=20, fill="both", expand=True)
+
+        self.create_menu()
+        self.create_widgets()
+        self.update_status_display()
+        self.depot.evenements.abonner(self.on_depot_events)
+        self.pump_events()
+
+    def create_menu(self):
+        menubar = tk.Menu(self.master)
+        self.file_menu = file_menu = tk.Menu(menubar, tearoff=0)
+        file_menu.add_command(label="Importer des véhicules...", command=lambda: self.import_file("vehicules"))
+        file_menu.add_command(label="Importer des livreurs...", command=lambda: self.import_file("livreurs"))
+        file_menu.add_command(label="Importer des commandes...", command=lambda: self.import_file("commandes"))
+        file_menu.add_command(label="Charger un gazetteer...", command=self.open_gazetteer)
+        menubar.add_cascade(label="Fichier", menu=file_menu)
+        self.master.config(menu=menubar)
+
+    def import_file(self, genre):
+        path = filedialog.askopenfilename(parent=self.master, filetypes=[("CSV", "*.csv"), ("JSON Lines", "*.jsonl")])
+        if not path:
+            return
+
+        def done(report):
+            self.end_task()
+            messagebox.showinfo("Import", str(report))
+
+        def failed(e):
+            self.end_task()
+            if isinstance(e, (OSError, UnicodeDecodeError, csv.Error)):
+                messagebox.showerror("Erreur", f"Impossible d'importer le fichier: {e}")
+            else:
+                messagebox.showerror("Erreur", f"Une erreur est survenue: {e}")
+
+        def progress(count):
+            self.progress_label.config(text=f"Import de {os.path.basename(path)}: {count} ligne(s) traitée(s)...")
+
+        self.start_task(
+            f"Import de {os.path.basename(path)}...",
+            lambda report_progress: ImportateurDepot(self.depot).importer(path, genre, path + ".rejets.jsonl", report_progress),
+            done, failed, progress,
+        )
+
+    def open_gazetteer(self):
+        path = filedialog.askopenfilename(parent=self.master, filetypes=[("CSV", "*.csv")])
+        if path:
+            self.load_gazetteer(path)
+
+    def load_gazetteer(self, path):
+        from itineraires import Gazetteer, OptimiseurTournees
+        try:
+            gazetteer = Gazetteer.depuis_fichier(path)
+        except (OSError, UnicodeDecodeError, csv.Error, KeyError, ValueError) as e:
+            messagebox.showerror("Erreur", f"Impossible de charger le gazetteer: {e}")
+            return
+        self.depot.optimiseur = OptimiseurTournees(gazetteer)
+        self.progress_label.config(text=f"Gazetteer {os.path.basename(path)}: {len(gazetteer.lieux)} lieu(x), tournées ordonnées avant livraison.")
+
+    def create_widgets(self):
+        button_font = ("Helvetica", 10, "bold")
+        label_font = ("Helvetica", 12)
+        title_font = ("Helvetica", 14, "bold")
+
+        button_colors = ["#4CAF50", "#2196F3", "#FFC107", "#9C27B0", "#FF5722", "#795548", "#009688"]
+        button_texts = [
+            "Ajouter un véhicule", "Ajouter un livreur", "Créer une commande",
+            "Attribuer véhicule au livreur", "Attribuer commande au livreur", "Répartir les commandes",
+            "Effectuer une livraison"
+        ]
+        button_commands = [
+            self.open_add_vehicule_window, self.open_add_livreur_window, self.open_create_commande_window,
+            self.open_assign_vehicule_window, self.open_assign_commande_window, self.dispatch_commandes,
+            self.open_perform_delivery_window
+        ]
+
+        for i, text in enumerate(button_texts):
+            button = tk.Button(
+                self.main_frame,
+                text=text,
+                command=button_commands[i],
+                font=button_font,
+                bg=button_colors[i],
+                fg="white",
+                padx=15, pady=10,
+                relief="raised",
+                bd=3,
+                cursor="hand2"
+            )
+            button.grid(row=0, column=i, padx=5, pady=10)
+            self.buttons.append(button)
+
+        tk.Label(
+            self.main_frame,
+            text="État du Dépôt:",
+            font=title_font,
+            bg="#E0F2F7",
+            fg="#2C3E50"
+        ).grid(row=1, column=0, columnspan=7, pady=15)
+        
+        self.status_text = tk.Text(
+            self.main_frame,
+            height=20, width=80,
+            state='disabled',
+            bg="#FFFFFF",
+            fg="#333333",
+            font=("Consolas", 10),
+            bd=2, relief="sunken"
+        )
+        self.status_text.grid(row=2, column=0, columnspan=7, padx=10, pady=10)
+
+        self.progress_label = tk.Label(self.main_frame, text="", font=label_font, bg="#E0F2F7", fg="#2C3E50")
+        self.progress_label.grid(row=3, column=0, columnspan=7)
+
+    def start_task(self, message, function, on_done, on_error=None, on_progress=None):
+        for button in self.buttons:
+            button.config(state='disabled')
+        for index in range(self.file_menu.index(tk.END) + 1):
+            self.file_menu.entryconfig(index, state='disabled')
+        self.progress_label.config(text=message)
+        self.tasks.submit(function, on_done, on_error or self.task_failed, on_progress)
+
+    def end_task(self):
+        for button in self.buttons:
+            button.config(state='normal')
+        for index in range(self.file_menu.index(tk.END) + 1):
+            self.file_menu.entryconfig(index, state='normal')
+        self.progress_label.config(text="")
+        self.depot.evenements.diffuser()
+
+    def task_failed(self, e):
+        self.end_task()
+        messagebox.showerror("Erreur", f"Une erreur est survenue: {e}")
+
+    def start_ingestion(self, port):
+        self.ingestion = ServiceIngestion(self.depot, port=port, soumettre=self.call_in_main_thread)
+        return self.ingestion.demarrer_en_arriere_plan()
+
+    def on_close(self):
+        if self.ingestion is not None:
+            self.ingestion.arreter(None if self.tasks.pending else self.run_main_thread_calls)
+            self.ingestion = None
+        self.cancel_main_thread_calls()
+        self.tasks.shutdown()
+        if self.journal is not None:
+            self.journal.compacter()
+            self.journal.fermer()
+        self.master.destroy()
+
+    def pump_events(self):
+        if not self.tasks.pending:
+            self.run_main_thread_calls()
+            self.depot.evenements.diffuser()
+        self.master.after(self.EVENT_PUMP_MS, self.pump_events)
+
+    def call_in_main_thread(self, function):
+        future = Future()
+        self.main_thread_calls.put((future, function))
+        return future
+
+    def run_main_thread_calls(self):
+        deadline = time.perf_counter() + self.MAIN_THREAD_BUDGET
+        while time.perf_counter() < deadline:
+            try:
+                future, function = self.main_thread_calls.get_nowait()
+            except queue.Empty:
+                return
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(function())
+                except Exception as e:
+                    future.set_exception(e)
+
+    def cancel_main_thread_calls(self):
+        while True:
+            try:
+                future, function = self.main_thread_calls.get_nowait()
+            except queue.Empty:
+                return
+            future.cancel()
+
+    def on_depot_events(self, events):
+        self.update_status_display(dict.fromkeys(event.entite for event in events))
+
+    def update_status_display(self, modifications=None):
+        self.status_text.config(state='normal')
+        if modifications is None or len(modifications) > max(self.FULL_RENDER_THRESHOLD, self.FULL_RENDER_FRACTION * len(self.status_marks)):
+            self.render_full_status()
+        else:
+            self.apply_status_changes(modifications)
+        self.status_text.config(state='disabled')
+
+    def render_full_status(self):
+        text = self.status_text
+        text.delete(1.0, tk.END)
+        if self.status_marks:
+            text.mark_unset(*self.status_marks.values())
+        self.status_marks = {}
+
+        chunks = ["--- État du Dépôt ---\n", ()]
+        entity_lines = []
+        section_ends = []
+        line = 2
+        for rank, (section, title, empty) in enumerate(Depot.SECTIONS):
+            if rank:
+                chunks += ["\n", ()]
+                line += 1
+            chunks += [f"{title}\n", (), f"{empty}\n", (f"empty:{section}",)]
+            line += 2
+            elements = self.depot.collection(section)
+            text.tag_configure(f"empty:{section}", elide=bool(elements))
+            for key, element in elements.items():
+                chunks += [f"- {element}\n", ()]
+                entity_lines.append(((section, key), line))
+                line += 1
+            section_ends.append((section, line))
+        text.insert(tk.END, *chunks)
+
+        for number, (entity, entity_line) in enumerate(entity_lines):
+            mark = f"entity{number}"
+            text.mark_set(mark, f"{entity_line}.0")
+            text.mark_gravity(mark, tk.LEFT)
+            self.status_marks[entity] = mark
+        self.next_status_mark = len(entity_lines)
+        for section, end_line in section_ends:
+            text.mark_set(f"end:{section}", f"{end_line}.0")
+
+    def apply_status_changes(self, modifications):
+        text = self.status_text
+        appended = {}
+        for entity in modifications:
+            section, key = entity
+            element = self.depot.collection(section).get(key)
+            mark = self.status_marks.get(entity)
+            if mark is not None:
+                if element is None:
+                    text.delete(mark, f"{mark} +1l linestart")
+                    text.mark_unset(mark)
+                    del self.status_marks[entity]
+                else:
+                    text.insert(mark, f"- {element}\n", ())
+                    text.delete(f"{mark} +1l linestart", f"{mark} +2l linestart")
+            elif element is not None:
+                appended.setdefault(section, []).append((entity, element))
+        for section, entries in appended.items():
+            first_line = int(text.index(f"end:{section}").split(".")[0])
+            text.insert(f"end:{section}", "".join([f"- {element}\n" for _, element in entries]), ())
+            for offset, (entity, _) in enumerate(entries):
+                mark = f"entity{self.next_status_mark}"
+                self.next_status_mark += 1
+                text.mark_set(mark, f"{first_line + offset}.0")
+                text.mark_gravity(mark, tk.LEFT)
+                self.status_marks[entity] = mark
+        for section, _, _ in Depot.SECTIONS:
+            text.tag_configure(f"empty:{section}", elide=bool(self.depot.collection(section)))
+
+    def open_add_vehicule_window(self):
+        add_vehicule_window = tk.Toplevel(self.master)
+        add_vehicule_window.title("Ajouter un véhicule")
+        add_vehicule_window.config(bg="#F0F8FF")
+        add_vehicule_window.transient(self.master)
+        add_vehicule_window.grab_set()
+
+        label_font = ("Helvetica", 10)
+        entry_font = ("Helvetica", 10)
+        button_font = ("Helvetica", 10, "bold")
+
+        tk.Label(add_vehicule_window, text="Type:", bg="#F0F8FF", font=label_font).grid(row=0, column=0, padx=5, pady=5)
+        vehicule_type = tk.StringVar(add_vehicule_window)
+        vehicule_type.set("Moto")
+        tk.OptionMenu(add_vehicule_window, vehicule_type, "Moto", "Camion").grid(row=0, column=1, padx=5, pady=5)
+
+        labels = ["Marque:", "Modèle:", "Immatriculation:"]
+        entries = {}
+        for i, text in enumerate(labels):
+            tk.Label(add_vehicule_window, text=text, bg="#F0F8FF", font=label_font).grid(row=i+1, column=0, padx=5, pady=5)
+            entry = tk.Entry(add_vehicule_window, font=entry_font)
+            entry.grid(row=i+1, column=1, padx=5, pady=5)
+            entries[text] = entry
+        
+        tk.Label(add_vehicule_window, text="Vitesse Maximale (pour Moto):", bg="#F0F8FF", font=label_font).grid(row=4, column=0, padx=5, pady=5)
+        vitesse_entry = tk.Entry(add_vehicule_window, font=entry_font)
+        vitesse_entry.grid(row=4, column=1, padx=5, pady=5)
+        
+        tk.Label(add_vehicule_window, text="Capacité en tonnes (pour Camion):", bg="#F0F8FF", font=label_font).grid(row=5, column=0, padx=5, pady=5)
+        capacite_entry = tk.Entry(add_vehicule_window, font=entry_font)
+        capacite_entry.grid(row=5, column=1, padx=5, pady=5)
+
+        def add_vehicule():
+            marque = entries["Marque:"].get()
+            modele = entries["Modèle:"].get()
+            immatriculation = entries["Immatriculation:"].get()
+            
+            if not (marque and modele and immatriculation):
+                messagebox.showerror("Erreur", "Veuillez remplir tous les champs obligatoires du véhicule.")
+                return
+
+            try:
+                if vehicule_type.get() == "Moto":
+                    vitesse = float(vitesse_entry.get())
+                    new_vehicule = Moto(marque, modele, immatriculation, vitesse)
+                elif vehicule_type.get() == "Camion":
+                    capacite = float(capacite_entry.get())
+                    new_vehicule = Camion(marque, modele, immatriculation, capacite)
+                
+                if not self.depot.ajouter_vehicule(new_vehicule):
+                    messagebox.showerror("Erreur", f"Un véhicule immatriculé {immatriculation} existe déjà.")
+                    return
+                messagebox.showinfo("Succès", "Véhicule ajouté avec succès !")
+                add_vehicule_window.destroy()
+            except ValueError:
+                messagebox.showerror("Erreur", "Veuillez entrer des nombres valides pour la vitesse/capacité.")
+            except Exception as e:
+                messagebox.showerror("Erreur", f"Une erreur est survenue: {e}")
+
+        tk.Button(add_vehicule_window, text="Ajouter", command=add_vehicule, bg="#4CAF50", fg="white", font=button_font, relief="raised", bd=3, cursor="hand2").grid(row=6, column=0, columnspan=2, pady=10, padx=5)
+
+    def open_add_livreur_window(self):
+        add_livreur_window = tk.Toplevel(self.master)
+        add_livreur_window.title("Ajouter un livreur")
+        add_livreur_window.config(bg="#F0F8FF")
+        add_livreur_window.transient(self.master)
+        add_livreur_window.grab_set()
+
+        label_font = ("Helvetica", 10)
+        entry_font = ("Helvetica", 10)
+        button_font = ("Helvetica", 10, "bold")
+
+        tk.Label(add_livreur_window, text="Nom:", bg="#F0F8FF", font=label_font).grid(row=0, column=0, padx=5, pady=5)
+        nom_entry = tk.Entry(add_livreur_window, font=entry_font)
+        nom_entry.grid(row=0, column=1, padx=5, pady=5)
+
+        def add_livreur():
+            nom = nom_entry.get()
+            if Livreur.verifier_nom(nom):
+                new_livreur = Livreur(nom)
+                if not self.depot.ajouter_livreur(new_livreur):
+                    messagebox.showerror("Erreur", f"Un livreur nommé {nom} existe déjà.")
+                    return
+                messagebox.showinfo("Succès", "Livreur ajouté avec succès !")
+                add_livreur_window.destroy()
+            else:
+                messagebox.showerror("Erreur", "Veuillez entrer un nom alphabétique valide.")
+
+        tk.Button(add_livreur_window, text="Ajouter", command=add_livreur, bg="#2196F3", fg="white", font=button_font, relief="raised", bd=3, cursor="hand2").grid(row=1, column=0, columnspan=2, pady=10, padx=5)
+
+    def open_create_commande_window(self):
+        create_commande_window = tk.Toplevel(self.master)
+        create_commande_window.title("Créer une commande")
+        create_commande_window.config(bg="#F0F8FF")
+        create_commande_window.transient(self.master)
+        create_commande_window.grab_set()
+
+        label_font = ("Helvetica", 10)
+        entry_font = ("Helvetica", 10)
+        button_font = ("Helvetica", 10, "bold")
+
+        tk.Label(create_commande_window, text="ID Commande:", bg="#F0F8FF", font=label_font).grid(row=0, column=0, padx=5, pady=5)
+        id_entry = tk.Entry(create_commande_window, font=entry_font)
+        id_entry.grid(row=0, column=1, padx=5, pady=5)
+
+        tk.Label(create_commande_window, text="Destination:", bg="#F0F8FF", font=label_font).grid(row=1, column=0, padx=5, pady=5)
+        destination_entry = tk.Entry(create_commande_window, font=entry_font)
+        destination_entry.grid(row=1, column=1, padx=5, pady=5)
+
+        tk.Label(create_commande_window, text="Poids (kg):", bg="#F0F8FF", font=label_font).grid(row=2, column=0, padx=5, pady=5)
+        poids_entry = tk.Entry(create_commande_window, font=entry_font)
+        poids_entry.grid(row=2, column=1, padx=5, pady=5)
+
+        def create_commande():
+            id_commande = id_entry.get()
+            destination = destination_entry.get()
+            try:
+                poids = float(poids_entry.get())
+                if not (id_commande and destination):
+                    messagebox.showerror("Erreur", "Veuillez remplir tous les champs.")
+                    return
+                if Commande.valider_poids(poids):
+                    new_commande = Commande(id_commande, destination, poids)
+                    if not self.depot.ajouter_commande_depot(new_commande):
+                        messagebox.showerror("Erreur", f"La commande {id_commande} existe déjà.")
+                        return
+                    messagebox.showinfo("Succès", "Commande créée avec succès !")
+                    create_commande_window.destroy()
+                else:
+                    messagebox.showerror("Erreur", "Poids invalide. Doit être entre 0 et 100 kg.")
+            except ValueError:
+                messagebox.showerror("Erreur", "Veuillez entrer une valeur numérique pour le poids.")
+
+        tk.Button(create_commande_window, text="Créer", command=create_commande, bg="#FFC107", fg="white", font=button_font, relief="raised", bd=3, cursor="hand2").grid(row=3, column=0, columnspan=2, pady=10, padx=5)
+
+    def open_assign_vehicule_window(self):
+        assign_window = tk.Toplevel(self.master)
+        assign_window.title("Attribuer un véhicule")
+        assign_window.config(bg="#F0F8FF")
+        assign_window.transient(self.master)
+        assign_window.grab_set()
+
+        label_font = ("Helvetica", 10)
+        listbox_font = ("Helvetica", 9)
+        button_font = ("Helvetica", 10, "bold")
+
+        tk.Label(assign_window, text="Sélectionner le livreur:", bg="#F0F8FF", font=label_font).grid(row=0, column=0, padx=5, pady=5)
+        livreur_listbox = VirtualListbox(assign_window, self.depot.livreurs_sans_vehicule(), label=lambda l: l.nom, key=lambda l: l.nom, height=5, font=listbox_font, bg="#E8F5E9", fg="#1B5E20")
+        livreur_listbox.grid(row=1, column=0, padx=5, pady=5)
+
+        tk.Label(assign_window, text="Sélectionner le véhicule:", bg="#F0F8FF", font=label_font).grid(row=0, column=1, padx=5, pady=5)
+        vehicule_listbox = VirtualListbox(assign_window, list(self.depot.vehicules_disponibles), key=lambda v: v._immatriculation, height=5, font=listbox_font, bg="#E3F2FD", fg="#0D47A1")
+        vehicule_listbox.grid(row=1, column=1, padx=5, pady=5)
+
+        def assign():
+            livreur = livreur_listbox.selected_item()
+            vehicule = vehicule_listbox.selected_item()
+
+            if livreur is None or vehicule is None:
+                messagebox.showerror("Erreur", "Veuillez sélectionner un livreur et un véhicule.")
+                return
+
+            if self.depot.attribuer_vehicule(livreur, vehicule):
+                messagebox.showinfo("Succès", f"Véhicule {vehicule._immatriculation} attribué à {livreur.nom} avec succès !")
+                assign_window.destroy()
+            else:
+                messagebox.showerror("Erreur", "Impossible d'attribuer le véhicule. Le livreur a peut-être déjà un véhicule ou les données sont incorrectes.")
+
+        tk.Button(assign_window, text="Attribuer", command=assign, bg="#9C27B0", fg="white", font=button_font, relief="raised", bd=3, cursor="hand2").grid(row=2, column=0, columnspan=2, pady=10, padx=5)
+
+    def open_assign_commande_window(self):
+        assign_commande_window = tk.Toplevel(self.master)
+        assign_commande_window.title("Attribuer une commande à un livreur")
+        assign_commande_window.config(bg="#F0F8FF")
+        assign_commande_window.transient(self.master)
+        assign_commande_window.grab_set()
+
+        label_font = ("Helvetica", 10)
+        listbox_font = ("Helvetica", 9)
+        button_font = ("Helvetica", 10, "bold")
+
+        tk.Label(assign_commande_window, text="Sélectionner le livreur:", bg="#F0F8FF", font=label_font).grid(row=0, column=0, padx=5, pady=5)
+        livreur_listbox = VirtualListbox(assign_commande_window, self.depot.livreurs_equipes(), label=lambda l: l.nom, key=lambda l: l.nom, height=5, font=listbox_font, bg="#FFF3E0", fg="#E65100")
+        livreur_listbox.grid(row=1, column=0, padx=5, pady=5)
+
+        tk.Label(assign_commande_window, text="Sélectionner la commande:", bg="#F0F8FF", font=label_font).grid(row=0, column=1, padx=5, pady=5)
+        commande_listbox = VirtualListbox(assign_commande_window, self.depot.commandes_en_attente.sequence(), key=lambda c: c.id, height=5, font=listbox_font, bg="#FCE4EC", fg="#AD1457")
+        commande_listbox.grid(row=1, column=1, padx=5, pady=5)
+
+        def assign_commande_to_livreur():
+            livreur = livreur_listbox.selected_item()
+            commande = commande_listbox.selected_item()
+
+            if livreur is None or commande is None:
+                messagebox.showerror("Erreur", "Veuillez sélectionner un livreur et une commande.")
+                return
+
+            if self.depot.attribuer_commande(livreur, commande):
+                messagebox.showinfo("Succès", f"Commande {commande.id} attribuée à {livreur.nom} avec succès !")
+                assign_commande_window.destroy()
+            else:
+                messagebox.showerror("Erreur", "Impossible d'attribuer une commande à un livreur sans véhicule.")
+
+        tk.Button(assign_commande_window, text="Attribuer la commande", command=assign_commande_to_livreur, bg="#FF5722", fg="white", font=button_font, relief="raised", bd=3, cursor="hand2").grid(row=2, column=0, columnspan=2, pady=10, padx=5)
+
+    def dispatch_commandes(self):
+        if not self.depot.commandes_en_attente:
+            messagebox.showinfo("Information", "Aucune commande en attente de distribution.")
+            return
+
+        def done(summary):
+            self.end_task()
+            messagebox.showinfo("Répartition des commandes", summary)
+
+        self.start_task("Répartition des commandes en cours...", lambda progress: str(Repartiteur(self.depot).repartir()), done)
+
+    def open_perform_delivery_window(self):
+        perform_delivery_window = tk.Toplevel(self.master)
+        perform_delivery_window.title("Effectuer une livraison")
+        perform_delivery_window.config(bg="#F0F8FF")
+        perform_delivery_window.transient(self.master)
+        perform_delivery_window.grab_set()
+
+        label_font = ("Helvetica", 10)
+        listbox_font = ("Helvetica", 9)
+        button_font = ("Helvetica", 10, "bold")
+
+        tk.Label(perform_delivery_window, text="Sélectionner le livreur pour effectuer la livraison:", bg="#F0F8FF", font=label_font).grid(row=0, column=0, padx=5, pady=5)
+        livreur_listbox = VirtualListbox(perform_delivery_window, self.depot.livreurs_avec_commandes(), label=lambda l: l.nom, key=lambda l: l.nom, height=5, font=listbox_font, bg="#E0F7FA", fg="#006064")
+        livreur_listbox.grid(row=1, column=0, padx=5, pady=5)
+
+        def perform_delivery():
+            livreur = livreur_listbox.selected_item()
+            if livreur is None:
+                messagebox.showerror("Erreur", "Veuillez sélectionner un livreur.")
+                return
+            
+            if livreur.vehicule is None:
+                messagebox.showerror("Erreur", f"{livreur.nom} n'a pas de véhicule pour effectuer la livraison.")
+                return
+
+            if not livreur.commandes_en_cours:
+                messagebox.showinfo("Information", f"{livreur.nom} n'a pas de commandes actuelles à livrer.")
+                return
+
+            perform_delivery_window.destroy()
+
+            def done(lines):
+                self.end_task()
+                ReportView(self.master, f"Rapport de Livraison - {livreur.nom}", lines)
+
+            self.start_task(f"Livraison de {livreur.nom} en cours...", lambda progress: list(livreur.livrer_commandes().lignes()), done)
+
+        tk.Button(perform_delivery_window, text="Effectuer la livraison", command=perform_delivery, bg="#009688", fg="white", font=button_font, relief="raised", bd=3, cursor="hand2").grid(row=2, column=0, pady=10, padx=5)
+
+if __name__ == "__main__":
+    instrumentation = Instrumentation.depuis_environnement()
+    if instrumentation is not None:
+        instrumentation.instrumenter(DeliveryApp, "update_status_display", "dispatch_commandes", "import_file", *[name for name in vars(DeliveryApp) if name.startswith("open_")])
+    root = tk.Tk()
+    app = DeliveryApp(root)
+    if os.environ.get("DEPOT_GAZETTEER"):
+        app.load_gazetteer(os.environ["DEPOT_GAZETTEER"])
+    if os.environ.get("DEPOT_INGESTION_PORT"):
+        app.start_ingestion(int(os.environ["DEPOT_INGESTION_PORT"]))
+    if instrumentation is not None:
+        def export_metrics():
+            instrumentation.exporter()
+            root.after(DeliveryApp.METRICS_EXPORT_MS, export_metrics)
+        export_metrics()
+    root.mainloop()
+    if instrumentation is not None:
+        instrumentation.fermer()
@@ -0,0 +1,301 @@
+import argparse
+from datetime import datetime, timezone
+import json
+import os
+import platform
+import random
+import select
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+
+from livraison import Camion, Depot, Livreur, Moto, Repartiteur
+from persistance import instantane_en_octets, lire_instantane
+from requetes import MoteurRequetes
+from scenarios import nom_livreur
+
+TAILLES = (1000, 100000, 1000000)
+COMMANDES_PAR_LIVREUR = 20
+DESTINATIONS = 200
+
+def generer_vehicules(generateur, nombre):
+    for rang in range(nombre):
+        if generateur.random() < 0.7:
+            yield Camion("Renault", "Master", f"C{rang}", generateur.choice((0.5, 1.0, 2.0, 3.5)))
+        else:
+            yield Moto("Yamaha", "NMax", f"M{rang}", generateur.choice((90, 110, 125)))
+
+def generer_livreurs(nombre):
+    for rang in range(nombre):
+        yield Livreur(nom_livreur(rang))
+
+def generer_commandes(generateur, nombre, destinations=DESTINATIONS):
+    for rang in range(nombre):
+        yield str(rang), f"Ville{generateur.randrange(destinations)}", round(generateur.uniform(0.1, 100), 2)
+
+def generer_depot(taille, graine=0):
+    generateur = random.Random(graine)
+    depot = Depot()
+    nombre_livreurs = max(1, taille // COMMANDES_PAR_LIVREUR)
+    for vehicule in generer_vehicules(generateur, nombre_livreurs):
+        depot.ajouter_vehicule(vehicule)
+    for livreur in generer_livreurs(nombre_livreurs):
+        depot.ajouter_livreur(livreur)
+    depot.creer_commandes(generer_commandes(generateur, taille))
+    return depot
+
+class JeuDonnees:
+    def __init__(self, taille, graine=0):
+        self.taille = taille
+        self.graine = graine
+        depot = generer_depot(taille, graine)
+        self.initial = instantane_en_octets(depot)
+        depot.equiper_livreurs()
+        self.equipe = instantane_en_octets(depot)
+        Repartiteur(depot).repartir()
+        self.reparti = instantane_en_octets(depot)
+
+    def depot(self, etat):
+        return lire_instantane(getattr(self, etat))
+
+    def commandes(self):
+        return list(generer_commandes(random.Random(self.graine), self.taille))
+
+def mesurer_creer_commandes(donnees):
+    depot = Depot()
+    lignes = donnees.commandes()
+    return lambda: depot.creer_commandes(lignes)
+
+def mesurer_attribuer_vehicule(donnees):
+    depot = donnees.depot("initial")
+    paires = list(zip(depot.livreurs_sans_vehicule(), list(depot.vehicules_disponibles)))
+    def mesure():
+        for livreur, vehicule in paires:
+            depot.attribuer_vehicule(livreur, vehicule)
+    return mesure
+
+def mesurer_repartir(donnees):
+    depot = donnees.depot("equipe")
+    return lambda: Repartiteur(depot).repartir()
+
+def mesurer_effectuer_livraison(donnees):
+    depot = donnees.depot("reparti")
+    livreurs = depot.livreurs_avec_commandes()
+    def mesure():
+        for livreur in livreurs:
+            livreur.effectuer_livraison()
+    return mesure
+
+def mesurer_afficher_etat(donnees):
+    depot = donnees.depot("initial")
+    return depot.afficher_etat
+
+def mesurer_requetes_poids(donnees):
+    moteur = MoteurRequetes(donnees.depot("initial"))
+    bornes = [(minimum, minimum + 5) for minimum in range(0, 100, 5)]
+    def mesure():
+        for minimum, maximum in bornes:
+            moteur.requete_commandes().en_attente().poids_entre(minimum, maximum).compter()
+            moteur.requete_commandes().destination("Ville7").poids_entre(minimum, maximum).compter()
+    return mesure
+
+class AffichageTk:
+    DELAI_XVFB = 10.0
+
+    def __init__(self):
+        self.processus = None
+        self.racine = None
+        self.erreur = None
+
+    def ouvrir(self):
+        if not os.environ.get("DISPLAY") and sys.platform.startswith("linux"):
+            xvfb = shutil.which("Xvfb")
+            if xvfb is None:
+                self.erreur = "pas d'affichage et Xvfb introuvable"
+                return None
+            lecture, ecriture = os.pipe()
+            self.processus = subprocess.Popen([xvfb, "-displayfd", str(ecriture), "-screen", "0", "1280x1024x24", "-nolisten", "tcp"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, pass_fds=(ecriture,))
+            os.close(ecriture)
+            with os.fdopen(lecture) as tube:
+                prets, _, _ = select.select([tube], [], [], self.DELAI_XVFB)
+                numero = tube.readline().strip() if prets else ""
+            if not numero.isdigit():
+                self.erreur = "Xvfb n'a pas démarré"
+                self.fermer()
+                return None
+            os.environ["DISPLAY"] = f":{numero}"
+        try:
+            import tkinter as tk
+            self.racine = tk.Tk()
+            self.racine.withdraw()
+        except Exception as e:
+            self.erreur = str(e)
+            self.fermer()
+        return self.racine
+
+    def fermer(self):
+        if self.racine is not None:
+            self.racine.destroy()
+            self.racine = None
+        if self.processus is not None:
+            self.processus.terminate()
+            self.processus.wait()
+            self.processus = None
+            os.environ.pop("DISPLAY", None)
+
+def nouvelle_fenetre(racine):
+    import tkinter as tk
+    for enfant in racine.winfo_children():
+        enfant.destroy()
+    return tk.Toplevel(racine)
+
+def mesurer_rendu_etat(donnees, racine):
+    from application import DeliveryApp
+    fenetre = nouvelle_fenetre(racine)
+    application = DeliveryApp(fenetre, donnees.depot("initial"))
+    def mesure():
+        application.update_status_display()
+        fenetre.update_idletasks()
+    return mesure
+
+def mesurer_liste_commandes(donnees, racine):
+    from application import VirtualListbox
+    fenetre = nouvelle_fenetre(racine)
+    depot = donnees.depot("initial")
+    def mesure():
+        liste = VirtualListbox(fenetre, depot.commandes_en_attente.sequence(), key=lambda c: c.id, height=5)
+        liste.filter_var.set("12")
+        fenetre.update_idletasks()
+        liste.destroy()
+    return mesure
+
+BANCS = {
+    "creer_commandes": mesurer_creer_commandes,
+    "attribuer_vehicule": mesurer_attribuer_vehicule,
+    "repartir": mesurer_repartir,
+    "effectuer_livraison": mesurer_effectuer_livraison,
+    "afficher_etat": mesurer_afficher_etat,
+    "requetes_poids": mesurer_requetes_poids,
+}
+
+BANCS_TK = {
+    "rendu_etat": mesurer_rendu_etat,
+    "liste_commandes": mesurer_liste_commandes,
+}
+
+def chronometrer(preparer, repetitions):
+    durees = []
+    for _ in range(repetitions):
+        mesure = preparer()
+        debut = time.perf_counter()
+        mesure()
+        durees.append(time.perf_counter() - debut)
+    return {"min": min(durees), "mediane": statistics.median(durees), "repetitions": repetitions}
+
+def revision_git():
+    try:
+        resultat = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return resultat.stdout.strip() or None
+
+def charger_historique(chemin):
+    if not chemin or not os.path.exists(chemin):
+        return []
+    with open(chemin, encoding="utf-8") as fichier:
+        return json.load(fichier)
+
+def enregistrer_historique(chemin, historique):
+    temporaire = chemin + ".tmp"
+    with open(temporaire, "w", encoding="utf-8") as fichier:
+        json.dump(historique, fichier, ensure_ascii=False, indent=1)
+    os.replace(temporaire, chemin)
+
+def reference(historique, cle, graine, repetitions, fenetre=5):
+    medianes = []
+    for execution in reversed(historique):
+        resultat = execution["resultats"].get(cle)
+        if resultat is not None and execution.get("graine") == graine and resultat.get("repetitions") == repetitions:
+            medianes.append(resultat["mediane"])
+            if len(medianes) == fenetre:
+                break
+    if not medianes:
+        return None
+    return statistics.median(medianes), len(medianes)
+
+def construire_parseur():
+    parseur = argparse.ArgumentParser(description="Bancs d'essai reproductibles du dépôt: opérations, répartition, livraison et rendu Tk.")
+    parseur.add_argument("--tailles", type=int, nargs="+", default=list(TAILLES), help="nombres de commandes générées")
+    parseur.add_argument("--bancs", nargs="+", choices=sorted(BANCS) + sorted(BANCS_TK), help="bancs à exécuter (tous par défaut)")
+    parseur.add_argument("--repetitions", type=int, default=3, help="nombre de mesures par banc")
+    parseur.add_argument("--graine", type=int, default=0, help="graine des générateurs de données")
+    parseur.add_argument("--sans-tk", action="store_true", help="ne pas mesurer les widgets Tk")
+    parseur.add_argument("--historique", default="bancs_essai.json", help="fichier JSON de l'historique des exécutions")
+    parseur.add_argument("--seuil", type=float, default=0.2, help="ralentissement relatif de la médiane signalé comme régression")
+    parseur.add_argument("--seuil-absolu", type=float, default=5.0, metavar="MS", help="ralentissement absolu minimal, en millisecondes, pour signaler une régression")
+    parseur.add_argument("--fenetre", type=int, default=5, help="nombre d'exécutions précédentes (même graine, même nombre de répétitions) dont la médiane sert de référence")
+    parseur.add_argument("--repetitions-min", type=int, default=3, help="nombre minimal de répétitions pour signaler une régression")
+    parseur.add_argument("--echouer-si-regression", action="store_true", help="code de sortie 1 si une régression est détectée")
+    return parseur
+
+def main(argv=None):
+    arguments = construire_parseur().parse_args(argv)
+    bancs = {nom: banc for nom, banc in BANCS.items() if not arguments.bancs or nom in arguments.bancs}
+    bancs_tk = {} if arguments.sans_tk else {nom: banc for nom, banc in BANCS_TK.items() if not arguments.bancs or nom in arguments.bancs}
+    historique = charger_historique(arguments.historique)
+    affichage = AffichageTk()
+    racine = None
+    if bancs_tk:
+        racine = affichage.ouvrir()
+        if racine is None:
+            print(f"Bancs Tk ignorés: {affichage.erreur}", file=sys.stderr)
+
+    resultats = {}
+    regressions = []
+    try:
+        for taille in arguments.tailles:
+            debut = time.perf_counter()
+            donnees = JeuDonnees(taille, arguments.graine)
+            print(f"Données {taille}: générées en {time.perf_counter() - debut:.2f} s")
+            mesures = [(nom, lambda banc=banc: banc(donnees)) for nom, banc in bancs.items()]
+            if racine is not None:
+                mesures += [(nom, lambda banc=banc: banc(donnees, racine)) for nom, banc in bancs_tk.items()]
+            for nom, preparer in mesures:
+                cle = f"{nom}@{taille}"
+                resultat = resultats[cle] = chronometrer(preparer, arguments.repetitions)
+                precedent = reference(historique, cle, arguments.graine, arguments.repetitions, arguments.fenetre)
+                ligne = f"{nom:<22}{taille:>9}  min {resultat['min'] * 1000:10.2f} ms  médiane {resultat['mediane'] * 1000:10.2f} ms"
+                if precedent is not None:
+                    mediane, nombre = precedent
+                    ecart = resultat["mediane"] / mediane - 1 if mediane else 0.0
+                    ligne += f"  {ecart:+.1%} (réf. {nombre} exécution(s))"
+                    if ecart > arguments.seuil and (resultat["mediane"] - mediane) * 1000 > arguments.seuil_absolu:
+                        if arguments.repetitions >= arguments.repetitions_min:
+                            ligne += "  RÉGRESSION"
+                            regressions.append(cle)
+                        else:
+                            ligne += "  (non signalé: trop peu de répétitions)"
+                print(ligne)
+    finally:
+        affichage.fermer()
+
+    historique.append({
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "revision": revision_git(),
+        "python": platform.python_version(),
+        "plateforme": platform.platform(),
+        "graine": arguments.graine,
+        "resultats": resultats,
+    })
+    if arguments.historique:
+        enregistrer_historique(arguments.historique, historique)
+    if regressions:
+        print(f"{len(regressions)} régression(s): {', '.join(regressions)}", file=sys.stderr)
+        if arguments.echouer_si_regression:
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+import threading
+import time
+
+class EvenementDepot:
+    AJOUT = "ajout"
+    ATTRIBUTION = "attribution"
+    RETRAIT = "retrait"
+    LIVRAISON = "livraison"
+    MODIFICATION = "modification"
+
+    __slots__ = ("type", "section", "cle", "cible")
+
+    def __init__(self, type_evenement, section, cle, cible=None):
+        self.type = type_evenement
+        self.section = section
+        self.cle = cle
+        self.cible = cible
+
+    @property
+    def entite(self):
+        return (self.section, self.cle)
+
+class Abonnement:
+    __slots__ = ("rappel", "types", "sections", "en_attente")
+
+    def __init__(self, rappel, types=None, sections=None):
+        self.rappel = rappel
+        self.types = frozenset(types) if types else None
+        self.sections = frozenset(sections) if sections else None
+        self.en_attente = []
+
+    def retenir(self, evenements):
+        if self.types is None and self.sections is None:
+            self.en_attente.extend(evenements)
+        else:
+            types, sections = self.types, self.sections
+            self.en_attente.extend(
+                evenement for evenement in evenements
+                if (types is None or evenement.type in types) and (sections is None or evenement.section in sections)
+            )
+
+class FluxEvenements:
+    def __init__(self, intervalle=0.0):
+        self.intervalle = intervalle
+        self.abonnes = []
+        self._verrou = threading.Lock()
+        self._derniere_diffusion = float("-inf")
+
+    def abonner(self, rappel, types=None, sections=None):
+        abonnement = Abonnement(rappel, types, sections)
+        with self._verrou:
+            self.abonnes = self.abonnes + [abonnement]
+        return abonnement
+
+    def desabonner(self, abonnement):
+        with self._verrou:
+            self.abonnes = [autre for autre in self.abonnes if autre is not abonnement]
+            abonnement.en_attente = []
+
+    def publier(self, *evenements):
+        with self._verrou:
+            for abonnement in self.abonnes:
+                abonnement.retenir(evenements)
+
+    def en_attente(self, abonnement=None):
+        if abonnement is not None:
+            return len(abonnement.en_attente)
+        return sum(len(abonnement.en_attente) for abonnement in self.abonnes)
+
+    def diffuser_abonnement(self, abonnement):
+        with self._verrou:
+            lot, abonnement.en_attente = abonnement.en_attente, []
+        if lot:
+            abonnement.rappel(lot)
+        return len(lot)
+
+    def diffuser(self, maintenant=None, forcer=False):
+        if not forcer and self.intervalle:
+            maintenant = time.monotonic() if maintenant is None else maintenant
+            if maintenant - self._derniere_diffusion < self.intervalle:
+                return 0
+            self._derniere_diffusion = maintenant
+        return sum(self.diffuser_abonnement(abonnement) for abonnement in self.abonnes)
@@ -0,0 +1,50 @@
+import numpy as np
+
+from livraison import Commande
+
+def colonne_poids(table, lignes=None):
+    poids = np.frombuffer(table.poids, dtype=np.float64)
+    return poids.copy() if lignes is None else poids[np.asarray(lignes, dtype=np.intp)]
+
+def poids_valides(poids):
+    poids = np.asarray(poids, dtype=np.float64)
+    return (poids > Commande.POIDS_MINIMAL) & (poids <= Commande.POIDS_MAXIMAL)
+
+def attributs_vehicules(vehicules):
+    limites = np.fromiter((vehicule.charge_maximale() for vehicule in vehicules), dtype=np.float64)
+    strictes = np.fromiter((vehicule.LIMITE_STRICTE for vehicule in vehicules), dtype=bool)
+    return limites, strictes
+
+def peut_transporter(poids, limites, strictes):
+    poids = np.asarray(poids, dtype=np.float64)[..., None]
+    return np.where(strictes, poids < limites, poids <= limites)
+
+def masques_par_classe(poids, vehicules):
+    classes = {}
+    for vehicule in vehicules:
+        classes.setdefault((type(vehicule).__name__, vehicule.charge_maximale(), vehicule.LIMITE_STRICTE), None)
+    if not classes:
+        return {}
+    limites = np.array([limite for _, limite, _ in classes], dtype=np.float64)
+    strictes = np.array([stricte for _, _, stricte in classes], dtype=bool)
+    masques = peut_transporter(poids, limites, strictes) & poids_valides(poids)[:, None]
+    return {classe: masques[:, rang] for rang, classe in enumerate(classes)}
+
+def matrice_faisabilite(poids, vehicules):
+    vehicules = list(vehicules)
+    classes = {}
+    groupes = np.fromiter(
+        (classes.setdefault((vehicule.charge_maximale(), vehicule.LIMITE_STRICTE), len(classes)) for vehicule in vehicules),
+        dtype=np.intp,
+        count=len(vehicules),
+    )
+    limites = np.array([limite for limite, _ in classes], dtype=np.float64)
+    strictes = np.array([stricte for _, stricte in classes], dtype=bool)
+    masques = peut_transporter(poids, limites, strictes) & poids_valides(poids)[:, None]
+    return masques[:, groupes]
+
+def commandes_sans_vehicule(poids, vehicules):
+    masques = masques_par_classe(poids, vehicules)
+    if not masques:
+        return np.ones(len(poids), dtype=bool)
+    return ~np.logical_or.reduce(list(masques.values()))
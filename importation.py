@@ -0,0 +1,168 @@
+from collections import Counter
+from itertools import islice
+import csv
+import json
+
+from livraison import Commande, Livreur, Vehicule
+
+class RapportImport:
+    APERCU = 20
+
+    def __init__(self, chemin_rejets=None):
+        self.acceptees = 0
+        self.rejetees = 0
+        self.echantillon = []
+        self.chemin_rejets = chemin_rejets
+        self._fichier_rejets = None
+
+    def rejeter(self, numero, motif, donnees):
+        self.rejetees += 1
+        if len(self.echantillon) < self.APERCU:
+            self.echantillon.append((numero, motif))
+        if self.chemin_rejets:
+            if self._fichier_rejets is None:
+                self._fichier_rejets = open(self.chemin_rejets, "w", encoding="utf-8")
+            self._fichier_rejets.write(json.dumps({"ligne": numero, "motif": motif, "donnees": donnees}, ensure_ascii=False, default=str) + "\n")
+
+    def fermer(self):
+        if self._fichier_rejets is not None:
+            self._fichier_rejets.close()
+            self._fichier_rejets = None
+
+    def __str__(self):
+        lignes = [f"{self.acceptees} ligne(s) importée(s), {self.rejetees} ligne(s) rejetée(s)."]
+        for numero, motif in self.echantillon:
+            lignes.append(f"- Ligne {numero}: {motif}")
+        if self.rejetees > len(self.echantillon):
+            lignes.append(f"- ... et {self.rejetees - len(self.echantillon)} autre(s) rejet(s)")
+        if self.chemin_rejets and self.rejetees:
+            lignes.append(f"Détail des rejets: {self.chemin_rejets}")
+        return "\n".join(lignes)
+
+class ImportateurDepot:
+    def __init__(self, depot, taille_lot=10000):
+        self.depot = depot
+        self.taille_lot = taille_lot
+
+    def importer(self, chemin, genre, chemin_rejets=None, progression=None):
+        rapport = RapportImport(chemin_rejets)
+        valider = {"commandes": self._valider_commandes, "livreurs": self._valider_livreurs, "vehicules": self._valider_vehicules}[genre]
+        inserer = {"commandes": self._inserer_commandes, "livreurs": self._inserer_livreurs, "vehicules": self._inserer_vehicules}[genre]
+        try:
+            for lot in self._par_lots(self._lire(chemin)):
+                inserer(valider(lot, rapport), rapport)
+                if progression is not None:
+                    progression(rapport.acceptees + rapport.rejetees)
+        finally:
+            rapport.fermer()
+        return rapport
+
+    @staticmethod
+    def _lire(chemin):
+        if chemin.endswith(".jsonl"):
+            with open(chemin, encoding="utf-8") as fichier:
+                for numero, ligne in enumerate(fichier, 1):
+                    if not ligne.strip():
+                        continue
+                    try:
+                        yield numero, json.loads(ligne)
+                    except ValueError:
+                        yield numero, None
+        else:
+            with open(chemin, newline="", encoding="utf-8") as fichier:
+                yield from enumerate(csv.DictReader(fichier), 2)
+
+    def _par_lots(self, lignes):
+        while True:
+            lot = list(islice(lignes, self.taille_lot))
+            if not lot:
+                return
+            yield lot
+
+    @staticmethod
+    def _texte(valeur):
+        if valeur is None:
+            return ""
+        if isinstance(valeur, bool) or not isinstance(valeur, (str, int, float)):
+            raise TypeError(f"Valeur non scalaire: {valeur!r}")
+        return str(valeur).strip()
+
+    @staticmethod
+    def _valider_commandes(lot, rapport):
+        valides = []
+        for numero, donnees in lot:
+            try:
+                id_commande = ImportateurDepot._texte(donnees["id"])
+                destination = ImportateurDepot._texte(donnees["destination"])
+                poids = float(donnees["poids"])
+            except (KeyError, TypeError, ValueError):
+                rapport.rejeter(numero, "ligne mal formée", donnees)
+                continue
+            if not (id_commande and destination):
+                rapport.rejeter(numero, "champ manquant", donnees)
+            elif not Commande.valider_poids(poids):
+                rapport.rejeter(numero, "poids invalide", donnees)
+            else:
+                valides.append((numero, id_commande, destination, poids))
+        return valides
+
+    @staticmethod
+    def _valider_livreurs(lot, rapport):
+        valides = []
+        for numero, donnees in lot:
+            nom = donnees.get("nom") if isinstance(donnees, dict) else None
+            if not isinstance(nom, str) or not Livreur.verifier_nom(nom):
+                rapport.rejeter(numero, "nom invalide", donnees)
+            else:
+                valides.append((numero, Livreur(nom)))
+        return valides
+
+    @staticmethod
+    def _valider_vehicules(lot, rapport):
+        valides = []
+        for numero, donnees in lot:
+            try:
+                donnees = dict(donnees)
+                if donnees["type"] == "Camion":
+                    donnees["capacite_tonnes"] = float(donnees["capacite_tonnes"])
+                elif donnees["type"] == "Moto":
+                    donnees["vitesse_maximale"] = float(donnees["vitesse_maximale"])
+                vehicule = Vehicule.depuis_dictionnaire(donnees)
+            except (KeyError, TypeError, ValueError):
+                rapport.rejeter(numero, "ligne mal formée", donnees)
+                continue
+            if vehicule is None:
+                rapport.rejeter(numero, "type de véhicule inconnu", donnees)
+            elif not (vehicule._marque and vehicule._modele and vehicule._immatriculation):
+                rapport.rejeter(numero, "champ manquant", donnees)
+            else:
+                valides.append((numero, vehicule))
+        return valides
+
+    def _inserer_commandes(self, valides, rapport):
+        doublons = Counter(self.depot.creer_commandes([ligne[1:] for ligne in valides]))
+        if not doublons:
+            rapport.acceptees += len(valides)
+            return
+        occurrences = Counter(ligne[1] for ligne in valides if ligne[1] in doublons)
+        for numero, id_commande, destination, poids in valides:
+            if id_commande in doublons:
+                occurrences[id_commande] -= 1
+                if occurrences[id_commande] < doublons[id_commande]:
+                    rapport.rejeter(numero, "commande en double", {"id": id_commande})
+                    continue
+            rapport.acceptees += 1
+
+    def _inserer_livreurs(self, valides, rapport):
+        for numero, livreur in valides:
+            if self.depot.ajouter_livreur(livreur):
+                rapport.acceptees += 1
+            else:
+                rapport.rejeter(numero, "livreur en double", {"nom": livreur.nom})
+
+    def _inserer_vehicules(self, valides, rapport):
+        for numero, vehicule in valides:
+            if self.depot.ajouter_vehicule(vehicule):
+                rapport.acceptees += 1
+            else:
+                rapport.rejeter(numero, "véhicule en double", vehicule.vers_dictionnaire())
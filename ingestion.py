@@ -0,0 +1,306 @@
+import argparse
+import asyncio
+from concurrent.futures import Future
+import functools
+import json
+import sys
+import threading
+
+from livraison import Depot
+from importation import ImportateurDepot, RapportImport
+from persistance import JournalDepot
+
+RAISONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 413: "Payload Too Large", 431: "Request Header Fields Too Large", 503: "Service Unavailable"}
+ENTETES_MAX = 100
+
+def executer_immediatement(fonction):
+    futur = Future()
+    try:
+        futur.set_result(fonction())
+    except Exception as e:
+        futur.set_exception(e)
+    return futur
+
+class ServiceIngestion:
+    def __init__(self, depot, hote="127.0.0.1", port=8765, taille_file=64, taille_lot=20000, attente_max=1.0, taille_max_requete=16 * 1024 * 1024, soumettre=None, delai_arret=5.0):
+        self.depot = depot
+        self.hote = hote
+        self.port = port
+        self.taille_file = taille_file
+        self.taille_lot = taille_lot
+        self.attente_max = attente_max
+        self.taille_max_requete = taille_max_requete
+        self.soumettre = soumettre or executer_immediatement
+        self.delai_arret = delai_arret
+        self.recues = 0
+        self.acceptees = 0
+        self.rejetees = 0
+        self.groupes = 0
+        self.refus = 0
+        self._file = None
+        self._arret = None
+        self._boucle = None
+        self._fil = None
+        self._connexions = set()
+        self._inactives = {}
+        self._pret = threading.Event()
+        self._erreur = None
+
+    async def servir(self):
+        self._boucle = asyncio.get_running_loop()
+        self._connexions = set()
+        self._inactives = {}
+        self._file = asyncio.Queue(self.taille_file)
+        self._arret = asyncio.Event()
+        serveur = await asyncio.start_server(self._connexion, self.hote, self.port)
+        self.port = serveur.sockets[0].getsockname()[1]
+        ecrivain = asyncio.create_task(self._ecrire())
+        try:
+            async with serveur:
+                self._pret.set()
+                await self._arret.wait()
+        finally:
+            try:
+                self._file.put_nowait(None)
+            except asyncio.QueueFull:
+                pass
+            termine, _ = await asyncio.wait({ecrivain}, timeout=self.delai_arret)
+            if not termine:
+                ecrivain.cancel()
+                await asyncio.wait({ecrivain})
+            while not self._file.empty():
+                demande = self._file.get_nowait()
+                if demande is not None:
+                    self._echouer([demande])
+            for ecrivain_connexion in self._inactives.values():
+                ecrivain_connexion.close()
+            if self._connexions:
+                await asyncio.wait(set(self._connexions), timeout=self.delai_arret)
+
+    def demarrer_en_arriere_plan(self):
+        self._fil = threading.Thread(target=self._executer, name="ingestion", daemon=True)
+        self._fil.start()
+        self._pret.wait()
+        if self._erreur is not None:
+            self._fil.join()
+            self._fil = None
+            raise self._erreur
+        return self.port
+
+    def _executer(self):
+        try:
+            asyncio.run(self.servir())
+        except Exception as e:
+            self._erreur = e
+        finally:
+            self._pret.set()
+
+    def arreter(self, pendant_attente=None):
+        if self._boucle is not None and self._arret is not None:
+            try:
+                self._boucle.call_soon_threadsafe(self._arret.set)
+            except RuntimeError:
+                pass
+        if self._fil is not None:
+            while self._fil.is_alive():
+                if pendant_attente is not None:
+                    pendant_attente()
+                self._fil.join(0.01)
+            self._fil = None
+
+    def etat(self):
+        return {
+            "recues": self.recues,
+            "acceptees": self.acceptees,
+            "rejetees": self.rejetees,
+            "groupes": self.groupes,
+            "refus": self.refus,
+            "en_file": self._file.qsize() if self._file is not None else 0,
+        }
+
+    async def _connexion(self, lecteur, ecrivain):
+        tache = asyncio.current_task()
+        self._connexions.add(tache)
+        try:
+            while not self._arret.is_set():
+                self._inactives[tache] = ecrivain
+                try:
+                    ligne = await lecteur.readline()
+                    del self._inactives[tache]
+                    if not ligne:
+                        break
+                    entetes = await self._lire_entetes(lecteur)
+                except (ValueError, asyncio.LimitOverrunError):
+                    self._inactives.pop(tache, None)
+                    await self._repondre(ecrivain, 431, {"erreur": "en-têtes trop longs ou trop nombreux"}, False)
+                    break
+                try:
+                    methode, chemin, _ = ligne.decode("latin-1").split(" ", 2)
+                    longueur = int(entetes.get("content-length") or 0)
+                except ValueError:
+                    longueur = -1
+                if longueur < 0:
+                    await self._repondre(ecrivain, 400, {"erreur": "requête mal formée"}, False)
+                    break
+                if longueur > self.taille_max_requete:
+                    await self._repondre(ecrivain, 413, {"erreur": f"requête limitée à {self.taille_max_requete} octets"}, False)
+                    break
+                corps = await lecteur.readexactly(longueur) if longueur else b""
+                garder = entetes.get("connection", "").lower() != "close"
+                if methode == "POST" and chemin == "/commandes":
+                    statut, reponse = await self._traiter(corps)
+                elif methode == "GET" and chemin == "/etat":
+                    statut, reponse = 200, self.etat()
+                else:
+                    statut, reponse = 404, {"erreur": f"{methode} {chemin} inconnu"}
+                await self._repondre(ecrivain, statut, reponse, garder)
+                if not garder:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._connexions.discard(tache)
+            self._inactives.pop(tache, None)
+            ecrivain.close()
+
+    @staticmethod
+    async def _lire_entetes(lecteur):
+        entetes = {}
+        while True:
+            entete = await lecteur.readline()
+            if entete in (b"\r\n", b"\n", b""):
+                return entetes
+            if len(entetes) >= ENTETES_MAX:
+                raise ValueError("Trop d'en-têtes")
+            nom, _, valeur = entete.decode("latin-1").partition(":")
+            entetes[nom.strip().lower()] = valeur.strip()
+
+    async def _repondre(self, ecrivain, statut, reponse, garder):
+        corps = json.dumps(reponse, ensure_ascii=False).encode("utf-8")
+        entetes = [
+            f"HTTP/1.1 {statut} {RAISONS[statut]}",
+            "Content-Type: application/json; charset=utf-8",
+            f"Content-Length: {len(corps)}",
+            f"Connection: {'keep-alive' if garder else 'close'}",
+        ]
+        if statut == 503:
+            entetes.append("Retry-After: 1")
+        ecrivain.write(("\r\n".join(entetes) + "\r\n\r\n").encode("latin-1") + corps)
+        await ecrivain.drain()
+
+    async def _traiter(self, corps):
+        try:
+            donnees = json.loads(corps)
+        except ValueError:
+            return 400, {"erreur": "JSON invalide"}
+        commandes = donnees.get("commandes") if isinstance(donnees, dict) else donnees
+        if not isinstance(commandes, list):
+            return 400, {"erreur": "une liste de commandes est attendue"}
+
+        rapport = RapportImport()
+        valides = ImportateurDepot._valider_commandes(enumerate(commandes), rapport)
+        self.recues += len(commandes)
+        lignes = [(id_commande, destination, poids) for _, id_commande, destination, poids in valides]
+        doublons = []
+        if lignes:
+            demande = (lignes, self._boucle.create_future())
+            try:
+                await asyncio.wait_for(self._file.put(demande), self.attente_max)
+            except asyncio.TimeoutError:
+                self.refus += len(commandes)
+                return 503, {"erreur": "file d'ingestion pleine, réessayer plus tard"}
+            try:
+                doublons = await demande[1]
+            except ConnectionAbortedError:
+                self.refus += len(commandes)
+                return 503, {"erreur": "service d'ingestion en cours d'arrêt"}
+        acceptees = len(lignes) - len(doublons)
+        self.acceptees += acceptees
+        self.rejetees += len(commandes) - acceptees
+        return 200, {
+            "acceptees": acceptees,
+            "rejetees": len(commandes) - acceptees,
+            "rejets": [{"rang": rang, "motif": motif} for rang, motif in rapport.echantillon],
+            "doublons": doublons[:RapportImport.APERCU],
+        }
+
+    async def _ecrire(self):
+        arret = False
+        while not arret and not (self._arret.is_set() and self._file.empty()):
+            demande = await self._file.get()
+            if demande is None:
+                break
+            groupe = [demande]
+            total = len(demande[0])
+            while total < self.taille_lot and not self._file.empty():
+                demande = self._file.get_nowait()
+                if demande is None:
+                    arret = True
+                    break
+                groupe.append(demande)
+                total += len(demande[0])
+            try:
+                doublons = await asyncio.wrap_future(self.soumettre(functools.partial(self._engager, [lignes for lignes, _ in groupe])))
+            except asyncio.CancelledError:
+                self._echouer(groupe)
+                raise
+            except Exception as e:
+                for _, futur in groupe:
+                    futur.set_exception(e)
+                continue
+            self.groupes += 1
+            for (_, futur), doublons_demande in zip(groupe, doublons):
+                futur.set_result(doublons_demande)
+
+    @staticmethod
+    def _echouer(demandes):
+        for _, futur in demandes:
+            if not futur.done():
+                futur.set_exception(ConnectionAbortedError("service d'ingestion arrêté"))
+
+    def _engager(self, demandes):
+        contient = self.depot.commandes.contient_id
+        vues = set()
+        doublons = []
+        for lignes in demandes:
+            doublons_demande = []
+            for ligne in lignes:
+                if ligne[0] in vues or contient(ligne[0]):
+                    doublons_demande.append(ligne[0])
+                else:
+                    vues.add(ligne[0])
+            doublons.append(doublons_demande)
+        self.depot.creer_commandes(ligne for lignes in demandes for ligne in lignes)
+        return doublons
+
+def construire_parseur():
+    parseur = argparse.ArgumentParser(description="Service local d'ingestion de commandes par lots JSON (POST /commandes, GET /etat).")
+    parseur.add_argument("--hote", default="127.0.0.1", help="adresse d'écoute")
+    parseur.add_argument("--port", type=int, default=8765, help="port d'écoute")
+    parseur.add_argument("--donnees", help="dossier de persistance du dépôt (journal et instantané)")
+    parseur.add_argument("--taille-file", type=int, default=64, help="nombre de lots en attente avant de refuser les envois")
+    parseur.add_argument("--taille-lot", type=int, default=20000, help="nombre maximal de commandes engagées ensemble")
+    return parseur
+
+def main(argv=None):
+    arguments = construire_parseur().parse_args(argv)
+    journal = None
+    if arguments.donnees:
+        journal = JournalDepot(arguments.donnees)
+        depot = journal.charger()
+    else:
+        depot = Depot()
+    service = ServiceIngestion(depot, arguments.hote, arguments.port, arguments.taille_file, arguments.taille_lot)
+    try:
+        asyncio.run(service.servir())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(json.dumps(service.etat(), ensure_ascii=False))
+        if journal is not None:
+            journal.compacter()
+            journal.fermer()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
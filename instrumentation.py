@@ -0,0 +1,225 @@
+from bisect import bisect_left
+from collections import Counter
+import functools
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import os
+import sys
+import threading
+import time
+
+from livraison import Depot, Livreur
+
+MUTATEURS_DEPOT = (
+    "ajouter_vehicule", "ajouter_livreur", "ajouter_commande_depot", "creer_commande", "creer_commandes",
+    "attribuer_vehicule", "attribuer_commande", "annuler_commande", "equiper_livreurs", "effectuer_livraisons",
+)
+
+class Histogramme:
+    BORNES = tuple(round(10 ** (exposant / 4) * 1e-6, 9) for exposant in range(29))
+
+    def __init__(self):
+        self.comptes = [0] * (len(self.BORNES) + 1)
+        self.nombre = 0
+        self.total = 0.0
+        self.maximum = 0.0
+
+    def ajouter(self, duree):
+        self.comptes[bisect_left(self.BORNES, duree)] += 1
+        self.nombre += 1
+        self.total += duree
+        if duree > self.maximum:
+            self.maximum = duree
+
+    def quantile(self, fraction):
+        if not self.nombre:
+            return 0.0
+        rang = fraction * self.nombre
+        cumul = 0
+        for position, compte in enumerate(self.comptes):
+            cumul += compte
+            if compte and cumul >= rang:
+                return min(self.BORNES[position], self.maximum) if position < len(self.BORNES) else self.maximum
+        return self.maximum
+
+class ProfileurEchantillonnage:
+    def __init__(self, dossier, seuil=0.5, intervalle=0.005, profondeur=64):
+        self.dossier = dossier
+        self.seuil = seuil
+        self.intervalle = intervalle
+        self.profondeur = profondeur
+        self.profils = []
+        self._actifs = {}
+        self._arret = threading.Event()
+        self._fil = threading.Thread(target=self._echantillonner, name="profileur", daemon=True)
+        self._fil.start()
+
+    def entrer(self, cle):
+        ident = threading.get_ident()
+        if ident in self._actifs:
+            return None
+        self._actifs[ident] = (cle, Counter())
+        return ident
+
+    def sortir(self, ident, duree):
+        cle, echantillons = self._actifs.pop(ident)
+        if duree >= self.seuil and echantillons:
+            self.profils.append(self._ecrire(cle, duree, echantillons))
+
+    def _echantillonner(self):
+        while not self._arret.wait(self.intervalle):
+            cadres = sys._current_frames()
+            for ident, (_, echantillons) in list(self._actifs.items()):
+                cadre = cadres.get(ident)
+                if cadre is not None:
+                    echantillons[self._pile(cadre)] += 1
+
+    def _pile(self, cadre):
+        appels = []
+        while cadre is not None and len(appels) < self.profondeur:
+            code = cadre.f_code
+            appels.append(f"{os.path.basename(code.co_filename)}:{code.co_name}:{cadre.f_lineno}")
+            cadre = cadre.f_back
+        return ";".join(reversed(appels))
+
+    def _ecrire(self, cle, duree, echantillons):
+        os.makedirs(self.dossier, exist_ok=True)
+        chemin = os.path.join(self.dossier, f"profil-{cle}-{time.strftime('%Y%m%d-%H%M%S')}-{len(self.profils)}.txt")
+        with open(chemin, "w", encoding="utf-8") as fichier:
+            fichier.write(f"# {cle}: {duree:.3f} s, {sum(echantillons.values())} échantillon(s) toutes les {self.intervalle * 1000:.0f} ms\n")
+            fichier.writelines(f"{pile} {nombre}\n" for pile, nombre in echantillons.most_common())
+        return chemin
+
+    def arreter(self):
+        self._arret.set()
+        self._fil.join()
+
+class Instrumentation:
+    def __init__(self, chemin=None):
+        self.chemin = chemin
+        self.histogrammes = {}
+        self.profileur = None
+        self.serveur = None
+        self._originaux = []
+        self._verrou = threading.Lock()
+
+    @classmethod
+    def depuis_environnement(cls, environnement=os.environ):
+        chemin = environnement.get("DEPOT_METRIQUES")
+        port = environnement.get("DEPOT_METRIQUES_PORT")
+        seuil = environnement.get("DEPOT_PROFIL_SEUIL")
+        if not (chemin or port or seuil):
+            return None
+        instrumentation = cls(chemin)
+        instrumentation.instrumenter_noyau()
+        if port:
+            instrumentation.servir(int(port))
+        if seuil:
+            instrumentation.profiler(os.path.dirname(os.path.abspath(chemin)) if chemin else os.getcwd(), float(seuil))
+        return instrumentation
+
+    def instrumenter(self, classe, *noms):
+        for nom in noms:
+            fonction = classe.__dict__[nom]
+            cle = f"{classe.__name__}.{nom}"
+            self.histogrammes.setdefault(cle, Histogramme())
+            setattr(classe, nom, self._envelopper(cle, fonction))
+            self._originaux.append((classe, nom, fonction))
+
+    def instrumenter_noyau(self):
+        self.instrumenter(Depot, *MUTATEURS_DEPOT)
+        self.instrumenter(Livreur, "livrer_commandes", "effectuer_livraison")
+
+    def retirer(self):
+        for classe, nom, fonction in reversed(self._originaux):
+            setattr(classe, nom, fonction)
+        self._originaux = []
+
+    def _envelopper(self, cle, fonction):
+        histogramme = self.histogrammes[cle]
+        verrou = self._verrou
+
+        @functools.wraps(fonction)
+        def enveloppe(*args, **kwargs):
+            profileur = self.profileur
+            jeton = profileur.entrer(cle) if profileur is not None else None
+            debut = time.perf_counter()
+            try:
+                return fonction(*args, **kwargs)
+            finally:
+                duree = time.perf_counter() - debut
+                with verrou:
+                    histogramme.ajouter(duree)
+                if jeton is not None:
+                    profileur.sortir(jeton, duree)
+        return enveloppe
+
+    def profiler(self, dossier, seuil=0.5, intervalle=0.005):
+        self.profileur = ProfileurEchantillonnage(dossier, seuil, intervalle)
+
+    def texte(self):
+        lignes = [
+            "# HELP depot_operation_seconds Durée des opérations instrumentées du dépôt.",
+            "# TYPE depot_operation_seconds histogram",
+        ]
+        with self._verrou:
+            for cle, histogramme in sorted(self.histogrammes.items()):
+                cumul = 0
+                for borne, compte in zip(Histogramme.BORNES, histogramme.comptes):
+                    cumul += compte
+                    lignes.append(f'depot_operation_seconds_bucket{{operation="{cle}",le="{borne:g}"}} {cumul}')
+                lignes.append(f'depot_operation_seconds_bucket{{operation="{cle}",le="+Inf"}} {histogramme.nombre}')
+                lignes.append(f'depot_operation_seconds_sum{{operation="{cle}"}} {histogramme.total:.9f}')
+                lignes.append(f'depot_operation_seconds_count{{operation="{cle}"}} {histogramme.nombre}')
+                lignes.append(f'depot_operation_seconds_max{{operation="{cle}"}} {histogramme.maximum:.9f}')
+        return "\n".join(lignes) + "\n"
+
+    def resume(self):
+        lignes = []
+        with self._verrou:
+            for cle, histogramme in sorted(self.histogrammes.items()):
+                if histogramme.nombre:
+                    lignes.append(
+                        f"{cle}: {histogramme.nombre} appel(s), moyenne {histogramme.total / histogramme.nombre * 1000:.2f} ms, "
+                        f"p50 ≤ {histogramme.quantile(0.5) * 1000:.2f} ms, p99 ≤ {histogramme.quantile(0.99) * 1000:.2f} ms, "
+                        f"max {histogramme.maximum * 1000:.2f} ms"
+                    )
+        return "\n".join(lignes)
+
+    def exporter(self, chemin=None):
+        chemin = chemin or self.chemin
+        if not chemin:
+            return
+        temporaire = chemin + ".tmp"
+        with open(temporaire, "w", encoding="utf-8") as fichier:
+            fichier.write(self.texte())
+        os.replace(temporaire, chemin)
+
+    def servir(self, port=0):
+        instrumentation = self
+
+        class Gestionnaire(BaseHTTPRequestHandler):
+            def do_GET(self):
+                corps = instrumentation.texte().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(corps)))
+                self.end_headers()
+                self.wfile.write(corps)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.serveur = ThreadingHTTPServer(("127.0.0.1", port), Gestionnaire)
+        threading.Thread(target=self.serveur.serve_forever, name="metriques", daemon=True).start()
+        return self.serveur.server_address[1]
+
+    def fermer(self):
+        if self.profileur is not None:
+            self.profileur.arreter()
+            self.profileur = None
+        if self.serveur is not None:
+            self.serveur.shutdown()
+            self.serveur.server_close()
+            self.serveur = None
+        self.exporter()
+        self.retirer()
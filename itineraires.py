@@ -0,0 +1,125 @@
+import csv
+import math
+
+import numpy as np
+
+RAYON_TERRE_KM = 6371.0
+
+class Gazetteer:
+    def __init__(self, lieux, origine=None, distance_inconnue_km=5.0):
+        self.lieux = {self.normaliser(nom): (float(latitude), float(longitude)) for nom, (latitude, longitude) in lieux.items()}
+        if origine is None and self.lieux:
+            latitudes, longitudes = zip(*self.lieux.values())
+            origine = (sum(latitudes) / len(latitudes), sum(longitudes) / len(longitudes))
+        self.origine = origine if origine is not None else (0.0, 0.0)
+        self.distance_inconnue_km = distance_inconnue_km
+        self._cos_latitude = math.cos(math.radians(self.origine[0]))
+        self._cache = {None: self._projeter(self.origine)}
+
+    @classmethod
+    def depuis_fichier(cls, chemin, origine=None):
+        with open(chemin, newline="", encoding="utf-8") as fichier:
+            lieux = {ligne["destination"]: (ligne["latitude"], ligne["longitude"]) for ligne in csv.DictReader(fichier)}
+        return cls(lieux, origine)
+
+    @staticmethod
+    def normaliser(destination):
+        return " ".join(destination.split()).casefold()
+
+    def _projeter(self, coordonnees):
+        latitude, longitude = coordonnees
+        return (
+            math.radians(longitude) * self._cos_latitude * RAYON_TERRE_KM,
+            math.radians(latitude) * RAYON_TERRE_KM,
+        )
+
+    def position(self, destination):
+        try:
+            return self._cache[destination]
+        except KeyError:
+            coordonnees = self.lieux.get(self.normaliser(destination))
+            position = None if coordonnees is None else self._projeter(coordonnees)
+            self._cache[destination] = position
+            return position
+
+    def __call__(self, origine, destination):
+        depart = self.position(origine)
+        arrivee = self.position(destination)
+        if depart is None or arrivee is None:
+            return self.distance_inconnue_km
+        return math.hypot(depart[0] - arrivee[0], depart[1] - arrivee[1])
+
+class OptimiseurTournees:
+    def __init__(self, gazetteer, iterations_max=1000):
+        self.gazetteer = gazetteer
+        self.iterations_max = iterations_max
+
+    def matrice_distances(self, positions):
+        points = np.asarray(positions, dtype=float)
+        ecarts = points[:, None, :] - points[None, :, :]
+        return np.hypot(ecarts[..., 0], ecarts[..., 1])
+
+    def ordre(self, destinations):
+        connues = []
+        inconnues = []
+        positions = [self.gazetteer.position(None)]
+        for rang, destination in enumerate(destinations):
+            position = self.gazetteer.position(destination)
+            if position is None:
+                inconnues.append(rang)
+            else:
+                connues.append(rang)
+                positions.append(position)
+        if len(connues) < 3:
+            return connues + inconnues
+
+        distances = self.matrice_distances(positions)
+        tour = self._plus_proche_voisin(distances)
+        tour = self._deux_opt(distances, tour)
+        return [connues[arret - 1] for arret in tour[1:-1]] + inconnues
+
+    def ordonner(self, commandes):
+        return [commandes[rang] for rang in self.ordre([commande.destination for commande in commandes])]
+
+    def optimiser(self, livreur):
+        livreur.commandes_en_cours = self.ordonner(livreur.commandes_en_cours)
+
+    @staticmethod
+    def _plus_proche_voisin(distances):
+        taille = len(distances)
+        visites = np.zeros(taille, dtype=bool)
+        tour = np.empty(taille + 1, dtype=np.intp)
+        tour[0] = tour[-1] = courant = 0
+        visites[0] = True
+        for rang in range(1, taille):
+            ligne = np.where(visites, np.inf, distances[courant])
+            courant = int(ligne.argmin())
+            visites[courant] = True
+            tour[rang] = courant
+        return tour
+
+    def _deux_opt(self, distances, tour):
+        nombre_aretes = len(tour) - 1
+        valides = np.triu(np.ones((nombre_aretes, nombre_aretes), dtype=bool), k=2)
+        valides[0, -1] = False
+        for _ in range(self.iterations_max):
+            debuts = tour[:-1]
+            fins = tour[1:]
+            longueurs = distances[debuts, fins]
+            gains = (
+                longueurs[:, None] + longueurs[None, :]
+                - distances[debuts[:, None], debuts[None, :]]
+                - distances[fins[:, None], fins[None, :]]
+            )
+            gains[~valides] = 0.0
+            meilleur = int(gains.argmax())
+            premiere, seconde = divmod(meilleur, nombre_aretes)
+            if gains[premiere, seconde] <= 1e-9:
+                break
+            tour[premiere + 1:seconde + 1] = tour[premiere + 1:seconde + 1][::-1]
+        return tour
+
+    def longueur(self, destinations):
+        positions = [self.gazetteer.position(None)] + [p for p in map(self.gazetteer.position, destinations) if p is not None] + [self.gazetteer.position(None)]
+        points = np.asarray(positions, dtype=float)
+        return float(np.hypot(*np.diff(points, axis=0).T).sum())
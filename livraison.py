@@ -0,0 +1,815 @@
+from abc import ABC, abstractmethod
+from itertools import islice
+from array import array
+import weakref
+import heapq
+
+from evenements import EvenementDepot, FluxEvenements
+
+class Vehicule(ABC):
+    LIMITE_STRICTE = False
+
+    def __init__(self, marque, modele, immatriculation):
+        self._marque = marque
+        self._modele = modele
+        self._immatriculation = immatriculation
+
+    def livrer(self, commande):
+        return self.message_livraison(commande, self.peut_transporter(commande.poids))
+
+    @abstractmethod
+    def message_livraison(self, commande, succes):
+        pass
+
+    @abstractmethod
+    def peut_transporter(self, poids):
+        pass
+
+    @abstractmethod
+    def charge_maximale(self):
+        pass
+
+    @abstractmethod
+    def vitesse_moyenne(self, charge=0):
+        pass
+
+    def vers_dictionnaire(self):
+        return {"type": type(self).__name__, "marque": self._marque, "modele": self._modele, "immatriculation": self._immatriculation}
+
+    @staticmethod
+    def depuis_dictionnaire(data):
+        if data["type"] == "Camion":
+            return Camion(data["marque"], data["modele"], data["immatriculation"], data["capacite_tonnes"])
+        elif data["type"] == "Moto":
+            return Moto(data["marque"], data["modele"], data["immatriculation"], data["vitesse_maximale"])
+        return None
+
+    def __str__(self):
+        return f"Marque: {self._marque}, Modèle: {self._modele}, Immatriculation: {self._immatriculation}"
+
+class Camion(Vehicule):
+    VITESSE_MOYENNE = 50
+
+    def __init__(self, marque, modele, immatriculation, capacite_tonnes):
+        super().__init__(marque, modele, immatriculation)
+        self.capacite_tonnes = capacite_tonnes
+
+    def peut_transporter(self, poids):
+        return poids <= self.charge_maximale()
+
+    def charge_maximale(self):
+        return self.capacite_tonnes * 1000
+
+    def vitesse_moyenne(self, charge=0):
+        if not self.charge_maximale():
+            return self.VITESSE_MOYENNE
+        return self.VITESSE_MOYENNE * (1 - 0.3 * min(charge / self.charge_maximale(), 1))
+
+    def message_livraison(self, commande, succes):
+        if succes:
+            return f"Le camion {self._marque} {self._modele} (capacité {self.capacite_tonnes} tonnes) livre la commande {commande.id}."
+        else:
+            return f"Le camion {self._marque} {self._modele} (capacité {self.capacite_tonnes} tonnes) ne peut pas livrer la commande {commande.id} en raison du poids excessif."
+
+    def vers_dictionnaire(self):
+        return {**super().vers_dictionnaire(), "capacite_tonnes": self.capacite_tonnes}
+
+    def __str__(self):
+        return super().__str__() + f", Capacité: {self.capacite_tonnes} tonnes"
+
+class Moto(Vehicule):
+    POIDS_MAXIMAL = 50
+    LIMITE_STRICTE = True
+
+    def __init__(self, marque, modele, immatriculation, vitesse_maximale):
+        super().__init__(marque, modele, immatriculation)
+        self.vitesse_maximale = vitesse_maximale
+
+    def peut_transporter(self, poids):
+        return poids < self.POIDS_MAXIMAL
+
+    def charge_maximale(self):
+        return self.POIDS_MAXIMAL
+
+    def vitesse_moyenne(self, charge=0):
+        return self.vitesse_maximale * 0.6 * (1 - 0.2 * min(charge / self.POIDS_MAXIMAL, 1))
+
+    def message_livraison(self, commande, succes):
+        if succes:
+            return f"La moto {self._marque} {self._modele} (vitesse {self.vitesse_maximale} km/h) livre la commande {commande.id}."
+        else:
+            return f"La moto {self._marque} {self._modele} (vitesse {self.vitesse_maximale} km/h) ne peut pas livrer la commande {commande.id} en raison du poids."
+
+    def vers_dictionnaire(self):
+        return {**super().vers_dictionnaire(), "vitesse_maximale": self.vitesse_maximale}
+
+    def __str__(self):
+        return super().__str__() + f", Vitesse Max: {self.vitesse_maximale} km/h"
+
+class TableCommandes:
+    def __init__(self, indexer_ids=True):
+        self.indexer_ids = indexer_ids
+        self.ids = []
+        self.poids = array("d")
+        self.statuts = bytearray()
+        self.destinations = array("I")
+        self.noms_statuts = ["en attente", "livrée"]
+        self.noms_destinations = []
+        self.codes_destinations = {}
+        self.lignes_par_id = {}
+        self.lignes_libres = []
+        self.vues = weakref.WeakValueDictionary()
+        self.depot = None
+
+    def code_statut(self, statut):
+        try:
+            return self.noms_statuts.index(statut)
+        except ValueError:
+            self.noms_statuts.append(statut)
+            return len(self.noms_statuts) - 1
+
+    def code_destination(self, destination):
+        code = self.codes_destinations.get(destination)
+        if code is None:
+            code = len(self.noms_destinations)
+            self.noms_destinations.append(destination)
+            self.codes_destinations[destination] = code
+        return code
+
+    def ajouter(self, id_commande, destination, poids, statut="en attente"):
+        destination = self.code_destination(destination)
+        statut = self.code_statut(statut)
+        if self.lignes_libres:
+            ligne = self.lignes_libres.pop()
+            self.ids[ligne] = id_commande
+            self.destinations[ligne] = destination
+            self.poids[ligne] = poids
+            self.statuts[ligne] = statut
+        else:
+            ligne = len(self.ids)
+            self.ids.append(id_commande)
+            self.destinations.append(destination)
+            self.poids.append(poids)
+            self.statuts.append(statut)
+        if self.indexer_ids:
+            self.lignes_par_id[id_commande] = ligne
+        return ligne
+
+    def liberer(self, ligne):
+        if self.indexer_ids:
+            self.lignes_par_id.pop(self.ids[ligne], None)
+        self.ids[ligne] = None
+        self.vues.pop(ligne, None)
+        self.lignes_libres.append(ligne)
+
+    def adopter(self, commande):
+        ancienne_table, ancienne_ligne = commande._table, commande._ligne
+        ligne = self.ajouter(commande.id, commande.destination, commande.poids, commande.statut)
+        commande._table, commande._ligne = self, ligne
+        self.vues[ligne] = commande
+        ancienne_table.liberer(ancienne_ligne)
+
+    def integrer(self, commande):
+        if commande._table is TableCommandes.libres:
+            self.adopter(commande)
+            return commande
+        return self.vue(self.ajouter(commande.id, commande.destination, commande.poids, commande.statut))
+
+    def contient_id(self, id_commande):
+        return id_commande in self.lignes_par_id
+
+    def signaler_modification(self, ligne, champ, valeur):
+        if self.depot is not None:
+            self.depot._signaler(EvenementDepot.MODIFICATION, "commandes", self.ids[ligne], champ)
+            self.depot._journaliser("modification", self.ids[ligne], champ, valeur)
+
+    def vue(self, ligne):
+        commande = self.vues.get(ligne)
+        if commande is None:
+            commande = Commande.__new__(Commande)
+            commande._table = self
+            commande._ligne = ligne
+            self.vues[ligne] = commande
+        return commande
+
+    def trouver(self, id_commande):
+        ligne = self.lignes_par_id.get(id_commande)
+        return None if ligne is None else self.vue(ligne)
+
+    def lignes_par_statut(self, statut):
+        if statut not in self.noms_statuts:
+            return
+        code = bytes([self.noms_statuts.index(statut)])
+        ligne = self.statuts.find(code)
+        while ligne != -1:
+            if self.ids[ligne] is not None:
+                yield ligne
+            ligne = self.statuts.find(code, ligne + 1)
+
+    def compter_statut(self, statut):
+        return sum(1 for _ in self.lignes_par_statut(statut))
+
+    def __len__(self):
+        return len(self.ids) - len(self.lignes_libres)
+
+class Commande:
+    __slots__ = ("_table", "_ligne", "__weakref__")
+
+    def __init__(self, id_commande, destination, poids, table=None):
+        table = table if table is not None else TableCommandes.libres
+        ligne = table.ajouter(id_commande, destination, poids)
+        self._table, self._ligne = table, ligne
+        table.vues[ligne] = self
+
+    def __del__(self):
+        if getattr(self, "_table", None) is TableCommandes.libres:
+            self._table.liberer(self._ligne)
+
+    @property
+    def id(self):
+        return self._table.ids[self._ligne]
+
+    @property
+    def destination(self):
+        return self._table.noms_destinations[self._table.destinations[self._ligne]]
+
+    @destination.setter
+    def destination(self, destination):
+        self._table.destinations[self._ligne] = self._table.code_destination(destination)
+        self._table.signaler_modification(self._ligne, "destination", destination)
+
+    @property
+    def poids(self):
+        return self._table.poids[self._ligne]
+
+    @poids.setter
+    def poids(self, poids):
+        self._table.poids[self._ligne] = poids
+        self._table.signaler_modification(self._ligne, "poids", poids)
+
+    @property
+    def statut(self):
+        return self._table.noms_statuts[self._table.statuts[self._ligne]]
+
+    @statut.setter
+    def statut(self, statut):
+        self._marquer(statut)
+        self._table.signaler_modification(self._ligne, "statut", statut)
+
+    def _marquer(self, statut):
+        self._table.statuts[self._ligne] = self._table.code_statut(statut)
+
+    def marquer_livree(self):
+        self.statut = "livrée"
+
+    POIDS_MINIMAL = 0
+    POIDS_MAXIMAL = 100
+
+    @staticmethod
+    def valider_poids(poids):
+        return Commande.POIDS_MINIMAL < poids <= Commande.POIDS_MAXIMAL
+
+    def __str__(self):
+        return f"Commande ID: {self.id}, Destination: {self.destination}, Poids: {self.poids} kg, Statut: {self.statut}"
+
+TableCommandes.libres = TableCommandes(indexer_ids=False)
+
+class ResultatLivraison:
+    LIVREE = "livree"
+    POIDS_EXCESSIF = "poids_excessif"
+
+    __slots__ = ("commande", "vehicule", "succes", "code")
+
+    def __init__(self, commande, vehicule, succes, code):
+        self.commande = commande
+        self.vehicule = vehicule
+        self.succes = succes
+        self.code = code
+
+    @property
+    def id_commande(self):
+        return self.commande.id
+
+    def __str__(self):
+        message = self.vehicule.message_livraison(self.commande, self.succes)
+        return f"{message} - Statut de la commande: {self.commande.statut}"
+
+class RapportLivraison:
+    SANS_VEHICULE = "sans_vehicule"
+    SANS_COMMANDE = "sans_commande"
+
+    def __init__(self, livreur, resultats, motif=None):
+        self.livreur = livreur
+        self.resultats = resultats
+        self.motif = motif
+
+    def nombre_livrees(self):
+        return sum(1 for resultat in self.resultats if resultat.succes)
+
+    def echecs(self):
+        return [resultat for resultat in self.resultats if not resultat.succes]
+
+    def lignes(self):
+        if self.motif == self.SANS_VEHICULE:
+            yield f"{self.livreur.nom} n'a pas de véhicule pour effectuer la livraison."
+        elif self.motif == self.SANS_COMMANDE:
+            yield f"{self.livreur.nom} n'a pas de commandes en cours."
+        for resultat in self.resultats:
+            yield str(resultat)
+
+    def __str__(self):
+        return "\n".join(self.lignes())
+
+class Livreur:
+    def __init__(self, nom, vehicule=None):
+        self.nom = nom
+        self._depot = None
+        self._vehicule = vehicule
+        self.commandes_en_cours = []
+
+    @property
+    def vehicule(self):
+        return self._vehicule
+
+    @vehicule.setter
+    def vehicule(self, vehicule):
+        self._vehicule = vehicule
+        if self._depot is not None:
+            self._depot._vehicule_attribue(self, vehicule)
+
+    def ajouter_commande(self, commande):
+        if self._depot is not None:
+            commande = self._depot._commande_attribuee(self, commande)
+        self.commandes_en_cours.append(commande)
+        if self._depot is not None:
+            self._depot._reindexer_livreur(self)
+            self._depot._signaler(EvenementDepot.ATTRIBUTION, "livreurs", self.nom, commande.id)
+            self._depot._journaliser("commande_livreur", self.nom, commande.id)
+
+    def charge_actuelle(self):
+        return sum(commande.poids for commande in self.commandes_en_cours)
+
+    def livrer_commandes(self):
+        if not self.vehicule:
+            return RapportLivraison(self, [], RapportLivraison.SANS_VEHICULE)
+        if not self.commandes_en_cours:
+            return RapportLivraison(self, [], RapportLivraison.SANS_COMMANDE)
+
+        if self._depot is not None and self._depot.optimiseur is not None:
+            self._depot.optimiseur.optimiser(self)
+        vehicule = self.vehicule
+        peut_transporter = vehicule.peut_transporter
+        resultats = []
+        for commande in self.commandes_en_cours:
+            if peut_transporter(commande.poids):
+                commande._marquer("livrée")
+                resultats.append(ResultatLivraison(commande, vehicule, True, ResultatLivraison.LIVREE))
+            else:
+                resultats.append(ResultatLivraison(commande, vehicule, False, ResultatLivraison.POIDS_EXCESSIF))
+        self.commandes_en_cours = []
+        if self._depot is not None:
+            self._depot._reindexer_livreur(self)
+            self._depot._signaler_livraison(self, resultats)
+            self._depot._journaliser("livraison", self.nom)
+        return RapportLivraison(self, resultats)
+
+    def effectuer_livraison(self):
+        return str(self.livrer_commandes())
+
+    @staticmethod
+    def verifier_nom(nom):
+        return nom.isalpha()
+
+    @classmethod
+    def depuis_dictionnaire(cls, data):
+        nom = data.get("nom")
+        vehicule_data = data.get("vehicule")
+        vehicule = None
+        if vehicule_data:
+            vehicule = Vehicule.depuis_dictionnaire(vehicule_data)
+        livreur = cls(nom, vehicule)
+        for id_commande, destination, poids, statut in data.get("commandes", []):
+            commande = Commande(id_commande, destination, poids)
+            commande.statut = statut
+            livreur.commandes_en_cours.append(commande)
+        return livreur
+
+    def vers_dictionnaire(self):
+        return {
+            "nom": self.nom,
+            "vehicule": self.vehicule.vers_dictionnaire() if self.vehicule else None,
+            "commandes": [[c.id, c.destination, c.poids, c.statut] for c in self.commandes_en_cours],
+        }
+
+    def __str__(self):
+        vehicule_info = str(self.vehicule) if self.vehicule else "Aucun véhicule"
+        return f"Livreur: {self.nom}, Véhicule: [{vehicule_info}], Commandes en cours: {len(self.commandes_en_cours)}"
+
+class IndexCles:
+    def __init__(self, cle):
+        self._cle = cle
+        self._elements = {}
+
+    def append(self, element):
+        cle = self._cle(element)
+        if cle in self._elements:
+            raise KeyError(cle)
+        self._elements[cle] = element
+
+    def remove(self, element):
+        cle = self._cle(element)
+        if self._elements.get(cle) is not element:
+            raise ValueError(f"{cle!r} n'est pas dans l'index")
+        del self._elements[cle]
+
+    def retirer(self, cle):
+        return self._elements.pop(cle, None)
+
+    def get(self, cle, defaut=None):
+        return self._elements.get(cle, defaut)
+
+    def items(self):
+        return self._elements.items()
+
+    def contient_cle(self, cle):
+        return cle in self._elements
+
+    def __contains__(self, element):
+        return self._elements.get(self._cle(element)) is element
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return list(self)[position]
+        if position < 0:
+            position += len(self._elements)
+        if not 0 <= position < len(self._elements):
+            raise IndexError(position)
+        return next(islice(self._elements.values(), position, None))
+
+    def __iter__(self):
+        return iter(self._elements.values())
+
+    def __len__(self):
+        return len(self._elements)
+
+    def __bool__(self):
+        return bool(self._elements)
+
+class SequenceCommandes:
+    def __init__(self, table, lignes):
+        self._table = table
+        self._lignes = lignes
+
+    def cles(self):
+        ids = self._table.ids
+        return [ids[ligne] for ligne in self._lignes]
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self._table.vue(ligne) for ligne in self._lignes[position]]
+        return self._table.vue(self._lignes[position])
+
+    def __iter__(self):
+        return map(self._table.vue, self._lignes)
+
+    def __len__(self):
+        return len(self._lignes)
+
+class CommandesEnAttente:
+    def __init__(self, table):
+        self._table = table
+        self._lignes = {}
+
+    def append(self, commande):
+        if commande._table is not self._table:
+            raise ValueError(f"{commande.id!r} n'appartient pas à la table du dépôt")
+        if commande._ligne in self._lignes:
+            raise KeyError(commande.id)
+        self._lignes[commande._ligne] = None
+
+    def ajouter_lignes(self, lignes):
+        self._lignes.update(dict.fromkeys(lignes))
+
+    def remove(self, commande):
+        if commande not in self:
+            raise ValueError(f"{commande.id!r} n'est pas dans l'index")
+        del self._lignes[commande._ligne]
+
+    def retirer(self, cle):
+        ligne = self._table.lignes_par_id.get(cle)
+        if ligne not in self._lignes:
+            return None
+        del self._lignes[ligne]
+        return self._table.vue(ligne)
+
+    def get(self, cle, defaut=None):
+        ligne = self._table.lignes_par_id.get(cle)
+        return self._table.vue(ligne) if ligne in self._lignes else defaut
+
+    def items(self):
+        table = self._table
+        return ((table.ids[ligne], table.vue(ligne)) for ligne in self._lignes)
+
+    def lignes(self):
+        return self._lignes.keys()
+
+    def sequence(self):
+        return SequenceCommandes(self._table, list(self._lignes))
+
+    def contient_cle(self, cle):
+        return self._table.lignes_par_id.get(cle) in self._lignes
+
+    def __contains__(self, commande):
+        return getattr(commande, "_table", None) is self._table and commande._ligne in self._lignes
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return list(self)[position]
+        if position < 0:
+            position += len(self._lignes)
+        if not 0 <= position < len(self._lignes):
+            raise IndexError(position)
+        return self._table.vue(next(islice(self._lignes, position, None)))
+
+    def __iter__(self):
+        return map(self._table.vue, self._lignes)
+
+    def __len__(self):
+        return len(self._lignes)
+
+    def __bool__(self):
+        return bool(self._lignes)
+
+class Depot:
+    SECTIONS = (
+        ("vehicules", "Véhicules disponibles:", "Aucun véhicule disponible."),
+        ("livreurs", "Livreurs disponibles:", "Aucun livreur disponible."),
+        ("commandes", "Commandes en attente de distribution:", "Aucune commande en attente de distribution."),
+    )
+
+    def __init__(self):
+        self.vehicules_disponibles = IndexCles(lambda v: v._immatriculation)
+        self.livreurs_disponibles = IndexCles(lambda l: l.nom)
+        self._vehicules = {}
+        self.commandes = TableCommandes()
+        self.commandes.depot = self
+        self.commandes_en_attente = CommandesEnAttente(self.commandes)
+        self._livreurs_sans_vehicule = {}
+        self._livreurs_equipes = {}
+        self._livreurs_avec_commandes = {}
+        self.evenements = FluxEvenements()
+        self.journal = None
+        self.optimiseur = None
+
+    def ajouter_vehicule(self, vehicule):
+        if vehicule._immatriculation in self._vehicules:
+            return False
+        self._vehicules[vehicule._immatriculation] = vehicule
+        self.vehicules_disponibles.append(vehicule)
+        self._signaler(EvenementDepot.AJOUT, "vehicules", vehicule._immatriculation)
+        if self.journal is not None:
+            self._journaliser("vehicule", vehicule.vers_dictionnaire())
+        return True
+
+    def ajouter_livreur(self, livreur):
+        if self.livreurs_disponibles.contient_cle(livreur.nom):
+            return False
+        self.livreurs_disponibles.append(livreur)
+        livreur._depot = self
+        if livreur.vehicule is not None:
+            self._vehicules.setdefault(livreur.vehicule._immatriculation, livreur.vehicule)
+        en_cours = []
+        for commande in livreur.commandes_en_cours:
+            if commande._table is not self.commandes:
+                existante = self.commandes.trouver(commande.id)
+                commande = existante if existante is not None else self.commandes.integrer(commande)
+            en_cours.append(commande)
+        livreur.commandes_en_cours = en_cours
+        self._reindexer_livreur(livreur)
+        self._signaler(EvenementDepot.AJOUT, "livreurs", livreur.nom)
+        if self.journal is not None:
+            self._journaliser("livreur", livreur.vers_dictionnaire())
+        return True
+
+    def ajouter_commande_depot(self, commande):
+        if commande._table is self.commandes or self.commandes.contient_id(commande.id):
+            return False
+        commande = self.commandes.integrer(commande)
+        self.commandes_en_attente.append(commande)
+        self._signaler(EvenementDepot.AJOUT, "commandes", commande.id)
+        self._journaliser("commande", commande.id, commande.destination, commande.poids)
+        return True
+
+    def creer_commande(self, id_commande, destination, poids):
+        if self.commandes.contient_id(id_commande):
+            return None
+        commande = Commande(id_commande, destination, poids, self.commandes)
+        self.commandes_en_attente.append(commande)
+        self._signaler(EvenementDepot.AJOUT, "commandes", id_commande)
+        self._journaliser("commande", id_commande, destination, poids)
+        return commande
+
+    def creer_commandes(self, lignes):
+        creees = []
+        doublons = []
+        table = self.commandes
+        nouvelles_lignes = []
+        for id_commande, destination, poids in lignes:
+            if table.contient_id(id_commande):
+                doublons.append(id_commande)
+                continue
+            nouvelles_lignes.append(table.ajouter(id_commande, destination, poids))
+            creees.append([id_commande, destination, poids])
+        if creees:
+            self.commandes_en_attente.ajouter_lignes(nouvelles_lignes)
+            if self.evenements.abonnes:
+                self.evenements.publier(*(EvenementDepot(EvenementDepot.AJOUT, "commandes", ligne[0]) for ligne in creees))
+            self._journaliser("commandes", creees)
+        return doublons
+
+    def attribuer_vehicule(self, livreur, vehicule):
+        if livreur in self.livreurs_disponibles and vehicule in self.vehicules_disponibles:
+            if livreur.vehicule is None:
+                livreur.vehicule = vehicule
+                return True
+            else:
+                return False
+        return False
+
+    def attribuer_commande(self, livreur, commande):
+        if livreur in self.livreurs_disponibles and commande in self.commandes_en_attente:
+            if livreur.vehicule is not None:
+                livreur.ajouter_commande(commande)
+                return True
+        return False
+
+    def _vehicule_attribue(self, livreur, vehicule):
+        immatriculation = None
+        if vehicule is not None:
+            immatriculation = vehicule._immatriculation
+            if immatriculation not in self._vehicules:
+                self.ajouter_vehicule(vehicule)
+            if vehicule in self.vehicules_disponibles:
+                self.vehicules_disponibles.remove(vehicule)
+                self._signaler(EvenementDepot.ATTRIBUTION, "vehicules", immatriculation, livreur.nom)
+        self._reindexer_livreur(livreur)
+        self._signaler(EvenementDepot.ATTRIBUTION, "livreurs", livreur.nom, immatriculation)
+        self._journaliser("vehicule_livreur", livreur.nom, immatriculation)
+
+    def _commande_attribuee(self, livreur, commande):
+        if commande._table is not self.commandes:
+            existante = self.commandes.trouver(commande.id)
+            if existante is None:
+                self.ajouter_commande_depot(commande)
+                existante = self.commandes.trouver(commande.id)
+            commande = existante
+        if commande in self.commandes_en_attente:
+            self.commandes_en_attente.remove(commande)
+            self._signaler(EvenementDepot.ATTRIBUTION, "commandes", commande.id, livreur.nom)
+        return commande
+
+    def annuler_commande(self, commande):
+        if commande not in self.commandes_en_attente:
+            return False
+        self.commandes_en_attente.remove(commande)
+        commande._marquer("annulée")
+        self._signaler(EvenementDepot.RETRAIT, "commandes", commande.id)
+        self._journaliser("annulation", commande.id)
+        return True
+
+    def equiper_livreurs(self):
+        equipes = 0
+        for livreur, vehicule in zip(self.livreurs_sans_vehicule(), list(self.vehicules_disponibles)):
+            equipes += self.attribuer_vehicule(livreur, vehicule)
+        return equipes
+
+    def collection(self, section):
+        if section == "vehicules":
+            return self.vehicules_disponibles
+        if section == "livreurs":
+            return self.livreurs_disponibles
+        return self.commandes_en_attente
+
+    def _journaliser(self, *enregistrement):
+        if self.journal is not None:
+            self.journal.ecrire(enregistrement)
+
+    def _signaler(self, type_evenement, section, cle, cible=None):
+        if self.evenements.abonnes:
+            self.evenements.publier(EvenementDepot(type_evenement, section, cle, cible))
+
+    def _signaler_livraison(self, livreur, resultats):
+        if self.evenements.abonnes:
+            self.evenements.publier(
+                *(EvenementDepot(EvenementDepot.LIVRAISON, "commandes", resultat.id_commande, livreur.nom) for resultat in resultats if resultat.succes),
+                EvenementDepot(EvenementDepot.LIVRAISON, "livreurs", livreur.nom),
+            )
+
+    def effectuer_livraisons(self):
+        return [livreur.livrer_commandes() for livreur in self.livreurs_avec_commandes()]
+
+    def trouver_vehicule(self, immatriculation):
+        return self._vehicules.get(immatriculation)
+
+    def trouver_livreur(self, nom):
+        return self.livreurs_disponibles.get(nom)
+
+    def trouver_commande(self, id_commande):
+        return self.commandes.trouver(id_commande)
+
+    def livreurs_sans_vehicule(self):
+        return list(self._livreurs_sans_vehicule.values())
+
+    def livreurs_equipes(self):
+        return list(self._livreurs_equipes.values())
+
+    def livreurs_avec_commandes(self):
+        return list(self._livreurs_avec_commandes.values())
+
+    def commandes_par_statut(self, statut):
+        return [self.commandes.vue(ligne) for ligne in self.commandes.lignes_par_statut(statut)]
+
+    def _reindexer_livreur(self, livreur):
+        nom = livreur.nom
+        if livreur.vehicule is None:
+            self._livreurs_sans_vehicule[nom] = livreur
+            self._livreurs_equipes.pop(nom, None)
+        else:
+            self._livreurs_equipes[nom] = livreur
+            self._livreurs_sans_vehicule.pop(nom, None)
+        if livreur.commandes_en_cours:
+            self._livreurs_avec_commandes[nom] = livreur
+        else:
+            self._livreurs_avec_commandes.pop(nom, None)
+
+    def afficher_etat(self):
+        morceaux = ["--- État du Dépôt ---\n"]
+        for rang, (section, titre, vide) in enumerate(self.SECTIONS):
+            if rang:
+                morceaux.append("\n")
+            morceaux.append(f"{titre}\n")
+            elements = self.collection(section)
+            if not elements:
+                morceaux.append(f"{vide}\n")
+            morceaux.extend([f"- {element}\n" for element in elements])
+        return "".join(morceaux)
+
+class ResultatRepartition:
+    APERCU = 20
+
+    def __init__(self):
+        self.attributions = {}
+        self.non_attribuees = []
+
+    def nombre_attribuees(self):
+        return sum(len(commandes) for commandes in self.attributions.values())
+
+    def __str__(self):
+        lignes = [f"{self.nombre_attribuees()} commande(s) attribuée(s) à {len(self.attributions)} livreur(s)."]
+        for nom, commandes in islice(self.attributions.items(), self.APERCU):
+            lignes.append(f"- {nom}: {len(commandes)} commande(s)")
+        if len(self.attributions) > self.APERCU:
+            lignes.append(f"- ... et {len(self.attributions) - self.APERCU} autre(s) livreur(s)")
+        if self.non_attribuees:
+            ids = ", ".join(str(commande.id) for commande in self.non_attribuees[:self.APERCU])
+            if len(self.non_attribuees) > self.APERCU:
+                ids += ", ..."
+            lignes.append(f"{len(self.non_attribuees)} commande(s) non attribuable(s): {ids}")
+        return "\n".join(lignes)
+
+class Repartiteur:
+    def __init__(self, depot):
+        self.depot = depot
+
+    def repartir(self):
+        resultat = ResultatRepartition()
+        tas_par_type = {}
+        for rang, livreur in enumerate(self.depot.livreurs_equipes()):
+            restante = livreur.vehicule.charge_maximale() - livreur.charge_actuelle()
+            if restante > 0:
+                tas_par_type.setdefault(type(livreur.vehicule), []).append((-restante, rang, livreur))
+        for tas in tas_par_type.values():
+            heapq.heapify(tas)
+
+        commandes = sorted(self.depot.commandes_en_attente, key=lambda c: c.poids, reverse=True)
+        for commande in commandes:
+            meilleur = None
+            for tas in tas_par_type.values():
+                if not tas:
+                    continue
+                restante, rang, livreur = tas[0]
+                if -restante >= commande.poids and livreur.vehicule.peut_transporter(commande.poids):
+                    if meilleur is None or restante < meilleur[0][0]:
+                        meilleur = (tas[0], tas)
+            if meilleur is None:
+                resultat.non_attribuees.append(commande)
+                continue
+            (restante, rang, livreur), tas = meilleur
+            self.depot.attribuer_commande(livreur, commande)
+            resultat.attributions.setdefault(livreur.nom, []).append(commande)
+            restante += commande.poids
+            if restante < 0:
+                heapq.heapreplace(tas, (restante, rang, livreur))
+            else:
+                heapq.heappop(tas)
+        return resultat
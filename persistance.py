@@ -0,0 +1,226 @@
+from array import array
+import io
+import json
+import mmap
+import os
+import struct
+import sys
+
+from livraison import Depot, Livreur, Vehicule
+
+ENTETE_INSTANTANE = b"DEPOTSNP"
+VERSION_INSTANTANE = 2
+VERSIONS_LISIBLES = (1, 2)
+
+def ecrire_instantane(depot, fichier, generation=0):
+    table = depot.commandes
+    lignes = range(len(table.ids))
+    if table.lignes_libres:
+        lignes = [ligne for ligne, id_commande in enumerate(table.ids) if id_commande is not None]
+    nouvelles_lignes = {ligne: rang for rang, ligne in enumerate(lignes)} if table.lignes_libres else None
+    renumeroter = nouvelles_lignes.__getitem__ if nouvelles_lignes is not None else int
+
+    tournees = array("I")
+    livreurs = []
+    for livreur in depot.livreurs_disponibles:
+        vehicule = livreur.vehicule
+        livreurs.append([livreur.nom, vehicule._immatriculation if vehicule else None, len(livreur.commandes_en_cours)])
+        tournees.extend(renumeroter(commande._ligne) for commande in livreur.commandes_en_cours)
+    ids = [table.ids[ligne] for ligne in lignes] if table.lignes_libres else table.ids
+    ids_texte = all(type(id_commande) is str and "\0" not in id_commande for id_commande in ids)
+    meta = {
+        "version": VERSION_INSTANTANE,
+        "generation": generation,
+        "ids": "texte" if ids_texte else "json",
+        "ordre_octets": sys.byteorder,
+        "vehicules": [vehicule.vers_dictionnaire() for vehicule in depot._vehicules.values()],
+        "disponibles": [vehicule._immatriculation for vehicule in depot.vehicules_disponibles],
+        "livreurs": livreurs,
+        "statuts": table.noms_statuts,
+        "destinations": table.noms_destinations,
+    }
+    en_attente = array("I", map(renumeroter, depot.commandes_en_attente.lignes()))
+    blocs = [
+        json.dumps(meta, ensure_ascii=False).encode("utf-8"),
+        ("\0".join(ids) if ids_texte else json.dumps(ids, ensure_ascii=False)).encode("utf-8"),
+        array("d", (table.poids[ligne] for ligne in lignes)) if table.lignes_libres else table.poids,
+        bytes(table.statuts[ligne] for ligne in lignes) if table.lignes_libres else table.statuts,
+        array("I", (table.destinations[ligne] for ligne in lignes)) if table.lignes_libres else table.destinations,
+        en_attente,
+        tournees,
+    ]
+    fichier.write(ENTETE_INSTANTANE + struct.pack("<QQ", len(blocs), len(lignes)))
+    for bloc in blocs:
+        donnees = memoryview(bloc).cast("B")
+        fichier.write(struct.pack("<Q", len(donnees)))
+        fichier.write(donnees)
+
+def lire_blocs(tampon, nombre=None):
+    if bytes(tampon[:len(ENTETE_INSTANTANE)]) != ENTETE_INSTANTANE:
+        raise ValueError("Les données ne sont pas un instantané de dépôt")
+    nombre_blocs, nombre_lignes = struct.unpack_from("<QQ", tampon, len(ENTETE_INSTANTANE))
+    position = len(ENTETE_INSTANTANE) + 16
+    blocs = []
+    with memoryview(tampon) as vue:
+        for _ in range(nombre_blocs if nombre is None else min(nombre, nombre_blocs)):
+            (taille,) = struct.unpack_from("<Q", tampon, position)
+            position += 8
+            blocs.append(bytes(vue[position:position + taille]))
+            position += taille
+    meta = json.loads(blocs[0])
+    if meta["version"] not in VERSIONS_LISIBLES:
+        raise ValueError(f"Version d'instantané non prise en charge: {meta['version']}")
+    return meta, blocs, nombre_lignes
+
+def generation_instantane(tampon):
+    meta, _, _ = lire_blocs(tampon, 1)
+    return meta.get("generation", 0)
+
+def lire_instantane(tampon, depot=None):
+    depot = depot if depot is not None else Depot()
+    meta, blocs, nombre_lignes = lire_blocs(tampon)
+
+    table = depot.commandes
+    if not nombre_lignes:
+        table.ids = []
+    elif meta.get("ids", "texte") == "json":
+        table.ids = json.loads(blocs[1])
+    else:
+        table.ids = blocs[1].decode("utf-8").split("\0")
+    table.poids = array("d", blocs[2])
+    table.statuts = bytearray(blocs[3])
+    table.destinations = array("I", blocs[4])
+    en_attente = array("I", blocs[5])
+    tournees = array("I", blocs[6])
+    if meta["ordre_octets"] != sys.byteorder:
+        for colonne in (table.poids, table.destinations, en_attente, tournees):
+            colonne.byteswap()
+    table.noms_statuts = meta["statuts"]
+    table.noms_destinations = meta["destinations"]
+    table.codes_destinations = {nom: code for code, nom in enumerate(table.noms_destinations)}
+    table.lignes_par_id = dict(zip(table.ids, range(len(table.ids))))
+
+    for data in meta["vehicules"]:
+        vehicule = Vehicule.depuis_dictionnaire(data)
+        depot._vehicules[vehicule._immatriculation] = vehicule
+    for immatriculation in meta["disponibles"]:
+        depot.vehicules_disponibles.append(depot._vehicules[immatriculation])
+    debut = 0
+    for nom, immatriculation, nombre in meta["livreurs"]:
+        livreur = Livreur(nom, depot._vehicules[immatriculation] if immatriculation else None)
+        livreur.commandes_en_cours = [table.vue(ligne) for ligne in tournees[debut:debut + nombre]]
+        debut += nombre
+        depot.ajouter_livreur(livreur)
+    depot.commandes_en_attente.ajouter_lignes(en_attente)
+    return depot
+
+def instantane_en_octets(depot):
+    tampon = io.BytesIO()
+    ecrire_instantane(depot, tampon)
+    return tampon.getvalue()
+
+class JournalDepot:
+    def __init__(self, dossier, seuil_compaction=100000):
+        self.dossier = dossier
+        self.seuil_compaction = seuil_compaction
+        self.chemin_journal = os.path.join(dossier, "journal.jsonl")
+        self.chemin_instantane = os.path.join(dossier, "instantane.bin")
+        self.depot = None
+        self.generation = 0
+        self._fichier = None
+        self._enregistrements = 0
+
+    def charger(self):
+        os.makedirs(self.dossier, exist_ok=True)
+        depot = Depot()
+        self.generation = 0
+        if os.path.exists(self.chemin_instantane):
+            with open(self.chemin_instantane, "rb") as fichier, mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_READ) as carte:
+                lire_instantane(carte, depot)
+                self.generation = generation_instantane(carte)
+        if os.path.exists(self.chemin_journal):
+            with open(self.chemin_journal, "r+b") as fichier:
+                position = 0
+                for ligne in fichier:
+                    if not ligne.endswith(b"\n"):
+                        break
+                    enregistrement = json.loads(ligne)
+                    if enregistrement[0] == "generation":
+                        if enregistrement[1] < self.generation:
+                            position = 0
+                            break
+                    else:
+                        self._rejouer(depot, enregistrement)
+                        self._enregistrements += 1
+                    position += len(ligne)
+                fichier.truncate(position)
+        self.depot = depot
+        self._fichier = open(self.chemin_journal, "a", encoding="utf-8")
+        if not self._fichier.tell():
+            self._ecrire_generation()
+        depot.journal = self
+        return depot
+
+    def _ecrire_generation(self):
+        self._fichier.write(json.dumps(["generation", self.generation]) + "\n")
+        self._fichier.flush()
+
+    def ecrire(self, enregistrement):
+        self._fichier.write(json.dumps(enregistrement, ensure_ascii=False) + "\n")
+        self._fichier.flush()
+        self._enregistrements += 1
+        if self._enregistrements >= self.seuil_compaction:
+            self.compacter()
+
+    def compacter(self):
+        temporaire = self.chemin_instantane + ".tmp"
+        with open(temporaire, "wb") as fichier:
+            ecrire_instantane(self.depot, fichier, self.generation + 1)
+            fichier.flush()
+            os.fsync(fichier.fileno())
+        os.replace(temporaire, self.chemin_instantane)
+        self.generation += 1
+        self._fichier.close()
+        self._fichier = open(self.chemin_journal, "w", encoding="utf-8")
+        self._ecrire_generation()
+        self._enregistrements = 0
+
+    def fermer(self):
+        if self._fichier is not None:
+            self._fichier.close()
+            self._fichier = None
+        if self.depot is not None:
+            self.depot.journal = None
+
+    @staticmethod
+    def _rejouer(depot, enregistrement):
+        operation, *arguments = enregistrement
+        if operation == "vehicule":
+            depot.ajouter_vehicule(Vehicule.depuis_dictionnaire(arguments[0]))
+        elif operation == "livreur":
+            depot.ajouter_livreur(Livreur.depuis_dictionnaire(arguments[0]))
+        elif operation == "commande":
+            depot.creer_commande(*arguments)
+        elif operation == "commandes":
+            depot.creer_commandes(arguments[0])
+        elif operation == "vehicule_livreur":
+            livreur = depot.trouver_livreur(arguments[0])
+            vehicule = depot.trouver_vehicule(arguments[1]) if arguments[1] is not None else None
+            if livreur is not None and (vehicule is not None or arguments[1] is None):
+                livreur.vehicule = vehicule
+        elif operation == "commande_livreur":
+            livreur, commande = depot.trouver_livreur(arguments[0]), depot.trouver_commande(arguments[1])
+            if livreur is not None and commande is not None:
+                livreur.ajouter_commande(commande)
+        elif operation == "modification":
+            commande = depot.trouver_commande(arguments[0])
+            if commande is not None and arguments[1] in ("poids", "destination", "statut"):
+                setattr(commande, arguments[1], arguments[2])
+        elif operation == "livraison":
+            livreur = depot.trouver_livreur(arguments[0])
+            if livreur is not None:
+                livreur.livrer_commandes()
+        elif operation == "annulation":
+            commande = depot.trouver_commande(arguments[0])
+            if commande is not None:
+                depot.annuler_commande(commande)
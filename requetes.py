@@ -0,0 +1,430 @@
+from array import array
+from bisect import bisect_left, bisect_right, insort
+import heapq
+from itertools import compress
+import math
+
+from evenements import EvenementDepot
+
+class ListeTriee:
+    TAILLE_SEAU = 1000
+
+    def __init__(self):
+        self._cles = []
+        self._valeurs = []
+        self._maximums = []
+        self._taille = 0
+
+    @classmethod
+    def depuis_colonne(cls, colonne, lignes):
+        return cls.depuis_ordre(colonne, sorted(lignes, key=colonne.__getitem__))
+
+    @classmethod
+    def depuis_ordre(cls, colonne, ordre):
+        liste = cls()
+        for debut in range(0, len(ordre), cls.TAILLE_SEAU):
+            valeurs = array("I", ordre[debut:debut + cls.TAILLE_SEAU])
+            liste._valeurs.append(valeurs)
+            liste._cles.append(array("d", map(colonne.__getitem__, valeurs)))
+            liste._maximums.append(liste._cles[-1][-1])
+        liste._taille = len(ordre)
+        return liste
+
+    def ajouter(self, cle, valeur):
+        self._taille += 1
+        if not self._cles:
+            self._cles.append(array("d", [cle]))
+            self._valeurs.append(array("I", [valeur]))
+            self._maximums.append(cle)
+            return
+        rang = min(bisect_left(self._maximums, cle), len(self._cles) - 1)
+        cles = self._cles[rang]
+        valeurs = self._valeurs[rang]
+        position = bisect_right(cles, cle)
+        cles.insert(position, cle)
+        valeurs.insert(position, valeur)
+        self._maximums[rang] = cles[-1]
+        if len(cles) > 2 * self.TAILLE_SEAU:
+            moitie = len(cles) // 2
+            self._cles.insert(rang + 1, cles[moitie:])
+            self._valeurs.insert(rang + 1, valeurs[moitie:])
+            del cles[moitie:]
+            del valeurs[moitie:]
+            self._maximums[rang] = cles[-1]
+            self._maximums.insert(rang + 1, self._cles[rang + 1][-1])
+
+    def retirer(self, cle, valeur):
+        rang = bisect_left(self._maximums, cle)
+        while rang < len(self._cles):
+            cles = self._cles[rang]
+            valeurs = self._valeurs[rang]
+            position = bisect_left(cles, cle)
+            while position < len(cles) and cles[position] == cle:
+                if valeurs[position] == valeur:
+                    del cles[position]
+                    del valeurs[position]
+                    self._taille -= 1
+                    if cles:
+                        self._maximums[rang] = cles[-1]
+                    else:
+                        del self._cles[rang], self._valeurs[rang], self._maximums[rang]
+                    return True
+                position += 1
+            if position < len(cles):
+                return False
+            rang += 1
+        return False
+
+    def entre(self, minimum=-math.inf, maximum=math.inf, inverse=False):
+        if not inverse:
+            for rang in range(bisect_left(self._maximums, minimum), len(self._cles)):
+                cles = self._cles[rang]
+                fin = bisect_right(cles, maximum)
+                yield from self._valeurs[rang][bisect_left(cles, minimum):fin]
+                if fin < len(cles):
+                    return
+        else:
+            for rang in range(min(bisect_right(self._maximums, maximum), len(self._cles) - 1), -1, -1):
+                cles = self._cles[rang]
+                debut = bisect_left(cles, minimum)
+                yield from reversed(self._valeurs[rang][debut:bisect_right(cles, maximum)])
+                if debut > 0:
+                    return
+
+    def _rang(self, cle, apres):
+        recherche = bisect_right if apres else bisect_left
+        rang = recherche(self._maximums, cle)
+        avant = sum(map(len, self._cles[:rang]))
+        if rang == len(self._cles):
+            return avant
+        return avant + recherche(self._cles[rang], cle)
+
+    def compter_entre(self, minimum=-math.inf, maximum=math.inf):
+        if minimum > maximum:
+            return 0
+        return self._rang(maximum, True) - self._rang(minimum, False)
+
+    def __len__(self):
+        return self._taille
+
+class IndexCommandes:
+    def __init__(self, depot):
+        self.depot = depot
+        table = depot.commandes
+        lignes = range(len(table.ids))
+        if table.lignes_libres:
+            lignes = [ligne for ligne, id_commande in enumerate(table.ids) if id_commande is not None]
+        self.poids_indexes = array("d", table.poids)
+        self.destinations_indexees = array("I", table.destinations)
+        ordre = sorted(lignes, key=table.poids.__getitem__)
+        self.par_poids = ListeTriee.depuis_ordre(table.poids, ordre)
+        par_code = {code: [] for code in range(len(table.noms_destinations))}
+        for ligne in ordre:
+            par_code[table.destinations[ligne]].append(ligne)
+        self.par_destination = {code: ListeTriee.depuis_ordre(table.poids, ordre_destination) for code, ordre_destination in par_code.items() if ordre_destination}
+        self.par_statut = {}
+        for code in range(len(table.noms_statuts)):
+            lignes_statut = set(compress(lignes, map(code.__eq__, table.statuts))) if not table.lignes_libres else {ligne for ligne in lignes if table.statuts[ligne] == code}
+            if lignes_statut:
+                self.par_statut[code] = lignes_statut
+        self.en_attente = set(depot.commandes_en_attente.lignes())
+
+    def _indexer(self, ligne):
+        table = self.depot.commandes
+        poids = table.poids[ligne]
+        destination = table.destinations[ligne]
+        self.par_poids.ajouter(poids, ligne)
+        self.par_destination.setdefault(destination, ListeTriee()).ajouter(poids, ligne)
+        manquantes = ligne + 1 - len(self.poids_indexes)
+        if manquantes > 0:
+            self.poids_indexes.extend([0.0] * manquantes)
+            self.destinations_indexees.extend([0] * manquantes)
+        self.poids_indexes[ligne] = poids
+        self.destinations_indexees[ligne] = destination
+
+    def ajouter(self, ligne):
+        self._indexer(ligne)
+        self.par_statut.setdefault(self.depot.commandes.statuts[ligne], set()).add(ligne)
+
+    def deplacer(self, ligne):
+        table = self.depot.commandes
+        poids = self.poids_indexes[ligne]
+        destination = self.destinations_indexees[ligne]
+        if poids == table.poids[ligne] and destination == table.destinations[ligne]:
+            return
+        self.par_poids.retirer(poids, ligne)
+        self.par_destination[destination].retirer(poids, ligne)
+        self._indexer(ligne)
+
+    def contient(self, ligne):
+        return ligne in self.par_statut.get(self.depot.commandes.statuts[ligne], ())
+
+    def reclasser(self, ligne):
+        for lignes in self.par_statut.values():
+            lignes.discard(ligne)
+        self.par_statut.setdefault(self.depot.commandes.statuts[ligne], set()).add(ligne)
+
+    def appliquer(self, evenement):
+        table = self.depot.commandes
+        if evenement.section == "livreurs":
+            if evenement.type == EvenementDepot.AJOUT:
+                for commande in self.depot.trouver_livreur(evenement.cle).commandes_en_cours:
+                    if not self.contient(commande._ligne):
+                        self.ajouter(commande._ligne)
+            return
+        ligne = table.lignes_par_id.get(evenement.cle)
+        if ligne is None:
+            return
+        if evenement.type == EvenementDepot.AJOUT:
+            self.ajouter(ligne)
+            self.en_attente.add(ligne)
+        elif evenement.type == EvenementDepot.ATTRIBUTION:
+            self.en_attente.discard(ligne)
+        elif evenement.type == EvenementDepot.MODIFICATION:
+            if evenement.cible == "statut":
+                self.reclasser(ligne)
+            else:
+                self.deplacer(ligne)
+        else:
+            self.en_attente.discard(ligne)
+            self.reclasser(ligne)
+
+class IndexVehicules:
+    def __init__(self, depot):
+        self.depot = depot
+        self.capacites = []
+        self.seaux = {}
+        for vehicule in depot._vehicules.values():
+            self.ajouter(vehicule)
+
+    def ajouter(self, vehicule):
+        capacite = vehicule.charge_maximale()
+        seau = self.seaux.get(capacite)
+        if seau is None:
+            seau = self.seaux[capacite] = {}
+            insort(self.capacites, capacite)
+        seau[vehicule._immatriculation] = vehicule
+
+    def entre(self, minimum=-math.inf, maximum=math.inf, inverse=False):
+        capacites = self.capacites[bisect_left(self.capacites, minimum):bisect_right(self.capacites, maximum)]
+        for capacite in reversed(capacites) if inverse else capacites:
+            yield from self.seaux[capacite].values()
+
+    def appliquer(self, evenement):
+        if evenement.type != EvenementDepot.AJOUT:
+            return
+        if evenement.section == "vehicules":
+            vehicule = self.depot.trouver_vehicule(evenement.cle)
+        else:
+            vehicule = self.depot.trouver_livreur(evenement.cle).vehicule
+        if vehicule is not None and vehicule._immatriculation not in self.seaux.get(vehicule.charge_maximale(), ()):
+            self.ajouter(vehicule)
+
+class RequeteCommandes:
+    CHAMPS = {
+        "id": lambda table, ligne: table.ids[ligne],
+        "destination": lambda table, ligne: table.noms_destinations[table.destinations[ligne]],
+        "statut": lambda table, ligne: table.noms_statuts[table.statuts[ligne]],
+        "poids": lambda table, ligne: table.poids[ligne],
+    }
+
+    def __init__(self, moteur):
+        self.moteur = moteur
+        self._destinations = None
+        self._statuts = None
+        self._en_attente = False
+        self._minimum = -math.inf
+        self._maximum = math.inf
+        self._tri = None
+        self._decroissant = False
+        self._limite = None
+
+    def destination(self, *destinations):
+        self._destinations = destinations
+        return self
+
+    def statut(self, *statuts):
+        self._statuts = statuts
+        return self
+
+    def en_attente(self):
+        self._en_attente = True
+        return self
+
+    def poids_entre(self, minimum=-math.inf, maximum=math.inf):
+        self._minimum = minimum
+        self._maximum = maximum
+        return self
+
+    def trier_par(self, champ, decroissant=False):
+        if champ not in self.CHAMPS:
+            raise ValueError(f"Champ de tri inconnu: {champ}")
+        self._tri = champ
+        self._decroissant = decroissant
+        return self
+
+    def limiter(self, nombre):
+        self._limite = nombre
+        return self
+
+    def _sources(self):
+        index = self.moteur.actualiser().commandes
+        table = self.moteur.depot.commandes
+        inverse = self._tri == "poids" and self._decroissant
+        if self._destinations is not None:
+            listes = [index.par_destination[table.codes_destinations[nom]] for nom in self._destinations if nom in table.codes_destinations and table.codes_destinations[nom] in index.par_destination]
+            return [liste.entre(self._minimum, self._maximum, inverse) for liste in listes], sum(liste.compter_entre(self._minimum, self._maximum) for liste in listes), True
+        tailles = [(index.par_poids.compter_entre(self._minimum, self._maximum), "poids")]
+        if self._statuts is not None:
+            tailles.append((sum(len(index.par_statut.get(code, ())) for code in self._codes_statuts()), "statut"))
+        if self._en_attente:
+            tailles.append((len(index.en_attente), "en_attente"))
+        taille, source = min(tailles)
+        if source == "poids":
+            return [index.par_poids.entre(self._minimum, self._maximum, inverse)], taille, True
+        if source == "statut":
+            return [index.par_statut.get(code, ()) for code in self._codes_statuts()], taille, False
+        return [index.en_attente], taille, False
+
+    def _codes_statuts(self):
+        noms = self.moteur.depot.commandes.noms_statuts
+        return [noms.index(statut) for statut in self._statuts if statut in noms]
+
+    def _filtre(self, bornes_verifiees):
+        index = self.moteur.commandes
+        table = self.moteur.depot.commandes
+        conditions = []
+        if self._en_attente:
+            en_attente = index.en_attente
+            conditions.append(lambda ligne: ligne in en_attente)
+        if self._statuts is not None:
+            codes = set(self._codes_statuts())
+            conditions.append(lambda ligne: table.statuts[ligne] in codes)
+        if not bornes_verifiees and (self._minimum > -math.inf or self._maximum < math.inf):
+            minimum, maximum = self._minimum, self._maximum
+            conditions.append(lambda ligne: minimum <= table.poids[ligne] <= maximum)
+        return conditions
+
+    def lignes(self):
+        sources, _, triees_par_poids = self._sources()
+        if len(sources) == 1:
+            lignes = iter(sources[0])
+        elif triees_par_poids and self._tri == "poids":
+            table = self.moteur.depot.commandes
+            lignes = heapq.merge(*sources, key=table.poids.__getitem__, reverse=self._decroissant)
+        else:
+            lignes = (ligne for source in sources for ligne in source)
+        for condition in self._filtre(triees_par_poids):
+            lignes = filter(condition, lignes)
+        if self._tri is not None and not (triees_par_poids and self._tri == "poids"):
+            table = self.moteur.depot.commandes
+            champ = self.CHAMPS[self._tri]
+            lignes = iter(sorted(lignes, key=lambda ligne: champ(table, ligne), reverse=self._decroissant))
+        if self._limite is not None:
+            lignes = (ligne for _, ligne in zip(range(self._limite), lignes))
+        return lignes
+
+    def commandes(self):
+        table = self.moteur.depot.commandes
+        return [table.vue(ligne) for ligne in self.lignes()]
+
+    def compter(self):
+        sources, taille, triees_par_poids = self._sources()
+        if not self._filtre(triees_par_poids) and self._limite is None:
+            return taille
+        return sum(1 for _ in self.lignes())
+
+    def somme_poids(self):
+        poids = self.moteur.depot.commandes.poids
+        return sum(map(poids.__getitem__, self.lignes()))
+
+    def agreger(self, champ):
+        if champ not in ("destination", "statut"):
+            raise ValueError(f"Champ d'agrégation inconnu: {champ}")
+        table = self.moteur.depot.commandes
+        colonne, noms = (table.destinations, table.noms_destinations) if champ == "destination" else (table.statuts, table.noms_statuts)
+        groupes = {}
+        for ligne in self.lignes():
+            groupe = groupes.get(colonne[ligne])
+            if groupe is None:
+                groupe = groupes[colonne[ligne]] = [0, 0.0]
+            groupe[0] += 1
+            groupe[1] += table.poids[ligne]
+        return {noms[code]: (nombre, poids) for code, (nombre, poids) in groupes.items()}
+
+class RequeteVehicules:
+    def __init__(self, moteur):
+        self.moteur = moteur
+        self._minimum = -math.inf
+        self._maximum = math.inf
+        self._disponibles = False
+        self._types = None
+        self._decroissant = False
+        self._limite = None
+
+    def capacite_entre(self, minimum=-math.inf, maximum=math.inf):
+        self._minimum = minimum
+        self._maximum = maximum
+        return self
+
+    def disponibles(self):
+        self._disponibles = True
+        return self
+
+    def de_type(self, *types):
+        self._types = types
+        return self
+
+    def trier_par_capacite(self, decroissant=False):
+        self._decroissant = decroissant
+        return self
+
+    def limiter(self, nombre):
+        self._limite = nombre
+        return self
+
+    def __iter__(self):
+        vehicules = self.moteur.actualiser().vehicules.entre(self._minimum, self._maximum, self._decroissant)
+        if self._disponibles:
+            disponibles = self.moteur.depot.vehicules_disponibles
+            vehicules = (vehicule for vehicule in vehicules if vehicule in disponibles)
+        if self._types is not None:
+            vehicules = (vehicule for vehicule in vehicules if isinstance(vehicule, self._types))
+        if self._limite is not None:
+            vehicules = (vehicule for _, vehicule in zip(range(self._limite), vehicules))
+        return iter(vehicules)
+
+    def vehicules(self):
+        return list(self)
+
+    def compter(self):
+        return sum(1 for _ in self)
+
+class MoteurRequetes:
+    def __init__(self, depot):
+        self.depot = depot
+        self.commandes = IndexCommandes(depot)
+        self.vehicules = IndexVehicules(depot)
+        self._abonnement = depot.evenements.abonner(self._appliquer, sections=("commandes", "vehicules", "livreurs"))
+
+    def _appliquer(self, evenements):
+        for evenement in evenements:
+            if evenement.section == "livreurs" and evenement.type != EvenementDepot.AJOUT:
+                continue
+            if evenement.section != "vehicules":
+                self.commandes.appliquer(evenement)
+            if evenement.section != "commandes":
+                self.vehicules.appliquer(evenement)
+
+    def actualiser(self):
+        self.depot.evenements.diffuser_abonnement(self._abonnement)
+        return self
+
+    def fermer(self):
+        self.depot.evenements.desabonner(self._abonnement)
+
+    def requete_commandes(self):
+        return RequeteCommandes(self)
+
+    def requete_vehicules(self):
+        return RequeteVehicules(self)
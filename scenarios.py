@@ -0,0 +1,144 @@
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+import os
+import random
+import zlib
+
+from livraison import Camion, Depot, Livreur, Moto, Repartiteur
+from persistance import instantane_en_octets, lire_instantane
+
+def nom_livreur(rang):
+    lettres = ""
+    rang += 1
+    while rang:
+        rang, reste = divmod(rang - 1, 26)
+        lettres = chr(ord("A") + reste) + lettres
+    return "Livreur" + lettres
+
+class Scenario:
+    def __init__(self, nom, graine=0, camions=0, capacite_tonnes=1.0, motos=0, vitesse_maximale=90, commandes=0, poids=(1, 100), destinations=50, instantane=None):
+        self.nom = nom
+        self.graine = graine
+        self.camions = camions
+        self.capacite_tonnes = capacite_tonnes
+        self.motos = motos
+        self.vitesse_maximale = vitesse_maximale
+        self.commandes = commandes
+        self.poids = poids
+        self.destinations = destinations
+        self.instantane = instantane
+
+    @classmethod
+    def depuis_depot(cls, nom, depot):
+        return cls(nom, instantane=instantane_en_octets(depot))
+
+    def construire_depot(self):
+        if self.instantane is not None:
+            return lire_instantane(self.instantane)
+        depot = Depot()
+        generateur = random.Random(self.graine)
+        vehicules = [Camion("Renault", "Master", f"{self.nom}-C{rang}", self.capacite_tonnes) for rang in range(self.camions)]
+        vehicules += [Moto("Yamaha", "NMax", f"{self.nom}-M{rang}", self.vitesse_maximale) for rang in range(self.motos)]
+        for rang, vehicule in enumerate(vehicules):
+            livreur = Livreur(nom_livreur(rang))
+            depot.ajouter_vehicule(vehicule)
+            depot.ajouter_livreur(livreur)
+            depot.attribuer_vehicule(livreur, vehicule)
+        tirer = generateur.triangular if len(self.poids) == 3 else generateur.uniform
+        depot.creer_commandes(
+            (f"{self.nom}-{rang}", f"Ville{generateur.randrange(self.destinations)}", round(tirer(*self.poids), 2))
+            for rang in range(self.commandes)
+        )
+        return depot
+
+class StatistiquesLivraison:
+    def __init__(self):
+        self.scenarios = 0
+        self.commandes = 0
+        self.non_attribuees = 0
+        self.tournees = 0
+        self.livrees = 0
+        self.echecs = 0
+        self.poids_livre = 0.0
+        self.livrees_par_vehicule = Counter()
+
+    def ajouter_rapports(self, rapports):
+        for rapport in rapports:
+            self.tournees += 1
+            type_vehicule = type(rapport.livreur.vehicule).__name__
+            for resultat in rapport.resultats:
+                if resultat.succes:
+                    self.livrees += 1
+                    self.poids_livre += resultat.commande.poids
+                    self.livrees_par_vehicule[type_vehicule] += 1
+                else:
+                    self.echecs += 1
+
+    def fusionner(self, autre):
+        self.scenarios += autre.scenarios
+        self.commandes += autre.commandes
+        self.non_attribuees += autre.non_attribuees
+        self.tournees += autre.tournees
+        self.livrees += autre.livrees
+        self.echecs += autre.echecs
+        self.poids_livre += autre.poids_livre
+        self.livrees_par_vehicule.update(autre.livrees_par_vehicule)
+        return self
+
+    def taux_livraison(self):
+        return self.livrees / self.commandes if self.commandes else 0.0
+
+    def __str__(self):
+        lignes = [
+            f"{self.scenarios} scénario(s), {self.commandes} commande(s), {self.tournees} tournée(s).",
+            f"Livrées: {self.livrees} ({self.taux_livraison():.1%}), échecs: {self.echecs}, non attribuées: {self.non_attribuees}.",
+            f"Poids livré: {self.poids_livre:.1f} kg.",
+        ]
+        for type_vehicule, nombre in sorted(self.livrees_par_vehicule.items()):
+            lignes.append(f"- {type_vehicule}: {nombre} commande(s) livrée(s)")
+        return "\n".join(lignes)
+
+def executer_scenario(scenario):
+    depot = scenario.construire_depot()
+    statistiques = StatistiquesLivraison()
+    statistiques.scenarios = 1
+    statistiques.commandes = len(depot.commandes_en_attente) + sum(len(livreur.commandes_en_cours) for livreur in depot.livreurs_disponibles)
+    depot.equiper_livreurs()
+    statistiques.non_attribuees = len(Repartiteur(depot).repartir().non_attribuees)
+    statistiques.ajouter_rapports(depot.effectuer_livraisons())
+    return statistiques
+
+def decouper_par_region(nom, depot, nombre_regions):
+    regions = [Depot() for _ in range(nombre_regions)]
+    for rang, livreur in enumerate(depot.livreurs_disponibles):
+        region = regions[rang % nombre_regions]
+        region.ajouter_livreur(Livreur.depuis_dictionnaire(livreur.vers_dictionnaire()))
+    for rang, vehicule in enumerate(depot.vehicules_disponibles):
+        regions[rang % nombre_regions].ajouter_vehicule(vehicule)
+    lots = [[] for _ in range(nombre_regions)]
+    for commande in depot.commandes_en_attente:
+        lots[zlib.crc32(commande.destination.encode("utf-8")) % nombre_regions].append((commande.id, commande.destination, commande.poids))
+    for region, lot in zip(regions, lots):
+        region.creer_commandes(lot)
+    return [Scenario.depuis_depot(f"{nom}-{rang}", region) for rang, region in enumerate(regions)]
+
+class ExecuteurScenarios:
+    def __init__(self, processus=None):
+        self.processus = processus or os.cpu_count() or 1
+
+    def executer(self, scenarios):
+        scenarios = list(scenarios)
+        if self.processus == 1 or len(scenarios) == 1:
+            resultats = map(executer_scenario, scenarios)
+            return self._fusionner(scenarios, resultats)
+        with ProcessPoolExecutor(max_workers=min(self.processus, len(scenarios))) as pool:
+            return self._fusionner(scenarios, pool.map(executer_scenario, scenarios))
+
+    @staticmethod
+    def _fusionner(scenarios, resultats):
+        par_scenario = {}
+        total = StatistiquesLivraison()
+        for scenario, statistiques in zip(scenarios, resultats):
+            par_scenario[scenario.nom] = statistiques
+            total.fusionner(statistiques)
+        return par_scenario, total
@@ -0,0 +1,179 @@
+from array import array
+from collections import deque
+import heapq
+import zlib
+
+from livraison import Camion, Moto
+from persistance import instantane_en_octets, lire_instantane
+
+class TrajetsHaches:
+    def __init__(self, rayon_km=20, etape_minimale_km=0.5):
+        self.rayon_km = rayon_km
+        self.etape_minimale_km = etape_minimale_km
+        self._positions = {None: 0.0}
+
+    def position(self, destination):
+        position = self._positions.get(destination)
+        if position is None:
+            position = zlib.crc32(destination.encode("utf-8")) % (self.rayon_km * 100) / 100
+            self._positions[destination] = position
+        return position
+
+    def __call__(self, origine, destination):
+        return abs(self.position(origine) - self.position(destination)) + self.etape_minimale_km
+
+class ResultatSimulation:
+    def __init__(self, nombre_lignes):
+        self.horloge = 0.0
+        self.tournees = {}
+        self.heures_livraison = array("d", [-1.0]) * nombre_lignes
+        self.temps_file = array("d")
+        self.longueurs_file = array("I")
+        self.impossibles = []
+        self._aire_file = 0.0
+
+    def echantillonner_file(self, temps, longueur):
+        if self.temps_file:
+            self._aire_file += self.longueurs_file[-1] * (temps - self.temps_file[-1])
+            if self.temps_file[-1] == temps:
+                self.longueurs_file[-1] = longueur
+                return
+        self.temps_file.append(temps)
+        self.longueurs_file.append(longueur)
+
+    def longueur_moyenne_file(self):
+        return self._aire_file / self.temps_file[-1] if self.temps_file and self.temps_file[-1] else 0.0
+
+    def longueur_max_file(self):
+        return max(self.longueurs_file, default=0)
+
+    def chronologie(self, nom):
+        return self.tournees.get(nom, [])
+
+    def nombre_livrees(self):
+        return sum(nombre for tournees in self.tournees.values() for _, _, nombre, _ in tournees)
+
+    def __str__(self):
+        return (
+            f"Simulation terminée à {self.horloge / 60:.1f} h: {self.nombre_livrees()} commande(s) livrée(s) "
+            f"en {sum(len(tournees) for tournees in self.tournees.values())} tournée(s), "
+            f"{len(self.impossibles)} commande(s) impossible(s). "
+            f"File d'attente: moyenne {self.longueur_moyenne_file():.1f}, maximum {self.longueur_max_file()}."
+        )
+
+class SimulationLivraison:
+    def __init__(self, depot, fin=24 * 60, duree_arret=3.0, trajet=None, arrivee=None, optimiseur=None):
+        self.depot = depot
+        self.fin = fin
+        self.duree_arret = duree_arret
+        self.trajet = trajet if trajet is not None else TrajetsHaches()
+        self.arrivee = arrivee
+        self.optimiseur = optimiseur
+        self._lignes_originales = None
+
+    def executer(self):
+        depot = lire_instantane(instantane_en_octets(self.depot))
+        self._lignes_originales = self.depot.commandes.lignes_par_id
+        resultat = ResultatSimulation(len(self.depot.commandes.ids))
+        livreurs = depot.livreurs_equipes()
+        capacite_camions = max((l.vehicule.charge_maximale() for l in livreurs if isinstance(l.vehicule, Camion)), default=0)
+        chargements = {l: [(-1, commande, commande.poids) for commande in l.commandes_en_cours] for l in livreurs if l.commandes_en_cours}
+        motos_inactives = deque(l for l in livreurs if isinstance(l.vehicule, Moto) and l not in chargements)
+        camions_inactifs = deque(l for l in livreurs if not isinstance(l.vehicule, Moto) and l not in chargements)
+
+        commandes = depot.commandes_en_attente.sequence()
+        if self.arrivee is not None:
+            arrivees = sorted((self.arrivee(commande), rang) for rang, commande in enumerate(commandes))
+        else:
+            arrivees = [(0.0, rang) for rang in range(len(commandes))]
+        legeres = deque()
+        lourdes = deque()
+        retours = []
+        prochaine_arrivee = 0
+        temps = 0.0
+
+        while True:
+            candidats = []
+            if prochaine_arrivee < len(arrivees):
+                candidats.append(arrivees[prochaine_arrivee][0])
+            if retours:
+                candidats.append(retours[0][0])
+            if chargements:
+                candidats.append(temps)
+            if not candidats:
+                break
+            temps = min(candidats)
+
+            while prochaine_arrivee < len(arrivees) and arrivees[prochaine_arrivee][0] <= temps:
+                commande = commandes[arrivees[prochaine_arrivee][1]]
+                poids = commande.poids
+                if poids < Moto.POIDS_MAXIMAL:
+                    legeres.append((prochaine_arrivee, commande, poids))
+                elif poids <= capacite_camions:
+                    lourdes.append((prochaine_arrivee, commande, poids))
+                else:
+                    resultat.impossibles.append(self.depot.commandes.vue(self._lignes_originales[commande.id]))
+                prochaine_arrivee += 1
+
+            while retours and retours[0][0] <= temps:
+                _, _, livreur = heapq.heappop(retours)
+                livreur.livrer_commandes()
+                (motos_inactives if isinstance(livreur.vehicule, Moto) else camions_inactifs).append(livreur)
+
+            for livreur, tournee in chargements.items():
+                files = (legeres,) if isinstance(livreur.vehicule, Moto) else (lourdes, legeres)
+                self._partir(livreur, temps, files if temps < self.fin else (), retours, resultat, tournee)
+            chargements = {}
+            if temps < self.fin:
+                self._faire_partir(motos_inactives, temps, (legeres,), retours, resultat)
+                self._faire_partir(camions_inactifs, temps, (lourdes, legeres), retours, resultat)
+            resultat.echantillonner_file(temps, len(legeres) + len(lourdes))
+
+        resultat.horloge = temps
+        return resultat
+
+    def _faire_partir(self, inactifs, depart, files, retours, resultat):
+        sans_tournee = []
+        while inactifs and any(files):
+            livreur = inactifs.popleft()
+            if not self._partir(livreur, depart, files, retours, resultat):
+                sans_tournee.append(livreur)
+        inactifs.extend(sans_tournee)
+
+    def _partir(self, livreur, depart, files, retours, resultat, tournee=()):
+        vehicule = livreur.vehicule
+        tournee = list(tournee)
+        restante = vehicule.charge_maximale() - sum(element[2] for element in tournee)
+        while True:
+            file = min((f for f in files if f), key=lambda f: f[0][0], default=None)
+            if file is None or file[0][2] > restante or not vehicule.peut_transporter(file[0][2]):
+                break
+            element = file.popleft()
+            restante -= element[2]
+            tournee.append(element)
+        if not tournee:
+            return False
+        if self.optimiseur is not None:
+            tournee = [tournee[rang] for rang in self.optimiseur.ordre([element[1].destination for element in tournee])]
+
+        charge = vehicule.charge_maximale() - restante
+        temps = depart
+        distance = 0.0
+        position = None
+        depot = livreur._depot
+        for rang, commande, poids in tournee:
+            etape = self.trajet(position, commande.destination)
+            distance += etape
+            temps += etape / max(vehicule.vitesse_moyenne(charge), 1.0) * 60 + self.duree_arret
+            resultat.heures_livraison[self._lignes_originales[commande.id]] = temps
+            charge -= poids
+            position = commande.destination
+            if rang >= 0:
+                depot.attribuer_commande(livreur, commande)
+        etape = self.trajet(position, None)
+        distance += etape
+        temps += etape / max(vehicule.vitesse_moyenne(0), 1.0) * 60
+
+        resultat.tournees.setdefault(livreur.nom, []).append((depart, temps, len(tournee), distance))
+        heapq.heappush(retours, (temps, id(livreur), livreur))
+        return True
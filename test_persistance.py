@@ -0,0 +1,130 @@
+import random
+import shutil
+import tempfile
+import unittest
+
+from livraison import Camion, Commande, Depot, Livreur, Moto, Repartiteur
+from persistance import JournalDepot, instantane_en_octets, lire_instantane
+
+def etat(depot):
+    table = depot.commandes
+    return (
+        depot.afficher_etat(),
+        sorted(
+            (repr(table.ids[ligne]), table.noms_destinations[table.destinations[ligne]], table.poids[ligne], table.noms_statuts[table.statuts[ligne]])
+            for ligne in range(len(table.ids)) if table.ids[ligne] is not None
+        ),
+        sorted(
+            (livreur.nom, livreur.vehicule._immatriculation if livreur.vehicule else None, [repr(commande.id) for commande in livreur.commandes_en_cours])
+            for livreur in depot.livreurs_disponibles
+        ),
+    )
+
+def operer(depot, generateur, rang):
+    choix = generateur.random()
+    if choix < 0.3:
+        identifiant = rang if generateur.random() < 0.3 else f"c{rang}"
+        depot.creer_commande(identifiant, f"Ville{generateur.randrange(8)}", round(generateur.uniform(1, 100), 2))
+    elif choix < 0.4:
+        depot.creer_commandes((f"l{rang}-{position}", f"Ville{generateur.randrange(8)}", 10.0) for position in range(3))
+    elif choix < 0.45:
+        depot.ajouter_vehicule(Camion("Renault", "Master", f"C{rang}", 1) if generateur.random() < 0.7 else Moto("Yamaha", "NMax", f"M{rang}", 90))
+    elif choix < 0.5:
+        depot.ajouter_livreur(Livreur(f"Livreur{rang}"))
+    elif choix < 0.55:
+        depot.equiper_livreurs()
+    elif choix < 0.6:
+        Repartiteur(depot).repartir()
+    elif choix < 0.65 and depot.livreurs_avec_commandes():
+        generateur.choice(depot.livreurs_avec_commandes()).livrer_commandes()
+    elif choix < 0.7 and depot.commandes_en_attente:
+        depot.annuler_commande(generateur.choice(depot.commandes_en_attente.sequence()))
+    elif choix < 0.8 and depot.commandes_en_attente:
+        commande = generateur.choice(depot.commandes_en_attente.sequence())
+        if generateur.random() < 0.5:
+            commande.poids = round(generateur.uniform(1, 100), 2)
+        else:
+            commande.destination = f"Ville{generateur.randrange(8)}"
+    elif choix < 0.85 and depot.livreurs_sans_vehicule():
+        generateur.choice(depot.livreurs_sans_vehicule()).vehicule = Camion("Iveco", "Daily", f"D{rang}", 2)
+    elif choix < 0.9 and depot.livreurs_disponibles:
+        generateur.choice(list(depot.livreurs_disponibles)).ajouter_commande(Commande(f"d{rang}", "Ville0", 5))
+
+class TestInstantane(unittest.TestCase):
+    def test_aller_retour(self):
+        generateur = random.Random(1)
+        depot = Depot()
+        for rang in range(400):
+            operer(depot, generateur, rang)
+        copie = lire_instantane(instantane_en_octets(depot))
+        self.assertEqual(etat(copie), etat(depot))
+        self.assertEqual(etat(lire_instantane(instantane_en_octets(copie))), etat(depot))
+
+    def test_ids_gardent_leur_type(self):
+        depot = Depot()
+        depot.creer_commande(7, "Paris", 3)
+        depot.creer_commande("7", "Lyon", 4)
+        copie = lire_instantane(instantane_en_octets(depot))
+        self.assertEqual(copie.trouver_commande(7).destination, "Paris")
+        self.assertEqual(copie.trouver_commande("7").destination, "Lyon")
+
+class TestJournal(unittest.TestCase):
+    def setUp(self):
+        self.dossier = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dossier)
+
+    def test_rejeu_apres_compactions(self):
+        generateur = random.Random(2)
+        journal = JournalDepot(self.dossier, seuil_compaction=150)
+        depot = journal.charger()
+        for rang in range(600):
+            operer(depot, generateur, rang)
+        attendu = etat(depot)
+        journal.fermer()
+        self.assertEqual(etat(JournalDepot(self.dossier).charger()), attendu)
+
+    def test_id_entier_apres_compaction(self):
+        journal = JournalDepot(self.dossier)
+        depot = journal.charger()
+        depot.ajouter_vehicule(Camion("Renault", "Master", "X", 1))
+        depot.ajouter_livreur(Livreur("Bob"))
+        depot.equiper_livreurs()
+        depot.creer_commande(7, "Paris", 3)
+        journal.compacter()
+        depot.attribuer_commande(depot.trouver_livreur("Bob"), depot.trouver_commande(7))
+        journal.fermer()
+        recharge = JournalDepot(self.dossier).charger()
+        self.assertEqual([commande.id for commande in recharge.trouver_livreur("Bob").commandes_en_cours], [7])
+
+    def test_journal_perime_ignore(self):
+        journal = JournalDepot(self.dossier)
+        depot = journal.charger()
+        depot.ajouter_vehicule(Camion("Renault", "Master", "X", 1))
+        depot.ajouter_livreur(Livreur("Bob"))
+        depot.equiper_livreurs()
+        depot.creer_commande("1", "Paris", 3)
+        depot.attribuer_commande(depot.trouver_livreur("Bob"), depot.trouver_commande("1"))
+        depot.trouver_livreur("Bob").livrer_commandes()
+        depot.creer_commande("2", "Lyon", 4)
+        depot.attribuer_commande(depot.trouver_livreur("Bob"), depot.trouver_commande("2"))
+        with open(journal.chemin_journal, "rb") as fichier:
+            ancien = fichier.read()
+        journal.compacter()
+        attendu = etat(depot)
+        journal.fermer()
+        with open(journal.chemin_journal, "wb") as fichier:
+            fichier.write(ancien)
+        self.assertEqual(etat(JournalDepot(self.dossier).charger()), attendu)
+
+    def test_enregistrement_sans_entite_ignore(self):
+        journal = JournalDepot(self.dossier)
+        journal.charger()
+        journal.fermer()
+        with open(journal.chemin_journal, "a", encoding="utf-8") as fichier:
+            fichier.write('["commande_livreur", "Inconnu", "x"]\n["livraison", "Inconnu"]\n["annulation", "x"]\n')
+        self.assertEqual(len(JournalDepot(self.dossier).charger().commandes), 0)
+
+if __name__ == "__main__":
+    unittest.main()
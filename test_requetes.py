@@ -0,0 +1,103 @@
+import random
+import unittest
+
+from banc_essai import generer_depot
+from livraison import Camion, Moto, Repartiteur
+from requetes import MoteurRequetes
+
+class TestRequetesCommandes(unittest.TestCase):
+    def setUp(self):
+        self.generateur = random.Random(3)
+        self.depot = generer_depot(3000)
+        self.depot.equiper_livreurs()
+        self.moteur = MoteurRequetes(self.depot)
+
+    def tearDown(self):
+        self.moteur.fermer()
+
+    def muter(self, tour):
+        generateur = self.generateur
+        depot = self.depot
+        table = depot.commandes
+        for rang in range(150):
+            commande = depot.trouver_commande(generateur.choice(table.ids))
+            choix = generateur.random()
+            if commande is None:
+                continue
+            if choix < 0.35:
+                commande.poids = round(generateur.uniform(0.1, 100), 2)
+            elif choix < 0.6:
+                commande.destination = f"Ville{generateur.randrange(250)}"
+            elif choix < 0.7:
+                commande.statut = generateur.choice(["en attente", "livrée", "perdue"])
+            elif choix < 0.8:
+                depot.annuler_commande(commande)
+            elif choix < 0.9:
+                depot.creer_commande(f"n{tour}-{rang}", f"Ville{generateur.randrange(250)}", round(generateur.uniform(0.1, 100), 2))
+        if tour % 5 == 2:
+            Repartiteur(depot).repartir()
+        if tour % 7 == 4:
+            for livreur in depot.livreurs_avec_commandes()[:3]:
+                livreur.livrer_commandes()
+
+    def lignes(self):
+        table = self.depot.commandes
+        return [ligne for ligne in range(len(table.ids)) if table.ids[ligne] is not None]
+
+    def test_requetes_conformes_au_parcours(self):
+        table = self.depot.commandes
+        for tour in range(25):
+            self.muter(tour)
+            minimum = self.generateur.uniform(0, 90)
+            maximum = minimum + 10
+            destination = f"Ville{self.generateur.randrange(250)}"
+            dans_bornes = [ligne for ligne in self.lignes() if minimum <= table.poids[ligne] <= maximum]
+            vers_destination = [ligne for ligne in dans_bornes if table.noms_destinations[table.destinations[ligne]] == destination]
+            en_attente = set(self.depot.commandes_en_attente.lignes())
+
+            self.assertEqual(sorted(self.moteur.requete_commandes().poids_entre(minimum, maximum).lignes()), dans_bornes)
+            self.assertEqual(self.moteur.requete_commandes().poids_entre(minimum, maximum).compter(), len(dans_bornes))
+            self.assertEqual(sorted(self.moteur.requete_commandes().destination(destination).poids_entre(minimum, maximum).lignes()), vers_destination)
+            self.assertEqual(sorted(self.moteur.requete_commandes().statut("perdue").lignes()), sorted(table.lignes_par_statut("perdue")))
+            self.assertEqual(sorted(self.moteur.requete_commandes().en_attente().lignes()), sorted(en_attente))
+            self.assertEqual(
+                sorted(self.moteur.requete_commandes().en_attente().poids_entre(minimum, maximum).lignes()),
+                [ligne for ligne in dans_bornes if ligne in en_attente],
+            )
+            self.assertEqual(
+                [table.poids[ligne] for ligne in self.moteur.requete_commandes().poids_entre(minimum, maximum).trier_par("poids", decroissant=True).limiter(20).lignes()],
+                sorted((table.poids[ligne] for ligne in dans_bornes), reverse=True)[:20],
+            )
+            self.assertAlmostEqual(self.moteur.requete_commandes().destination(destination).somme_poids(), sum(table.poids[ligne] for ligne in self.lignes() if table.noms_destinations[table.destinations[ligne]] == destination))
+
+    def test_agregation(self):
+        table = self.depot.commandes
+        for tour in range(5):
+            self.muter(tour)
+        attendu = {}
+        for ligne in self.lignes():
+            nombre, poids = attendu.get(table.noms_statuts[table.statuts[ligne]], (0, 0.0))
+            attendu[table.noms_statuts[table.statuts[ligne]]] = (nombre + 1, poids + table.poids[ligne])
+        obtenu = self.moteur.requete_commandes().agreger("statut")
+        self.assertEqual(obtenu.keys(), attendu.keys())
+        for statut, (nombre, poids) in attendu.items():
+            self.assertEqual(obtenu[statut][0], nombre)
+            self.assertAlmostEqual(obtenu[statut][1], poids)
+
+class TestRequetesVehicules(unittest.TestCase):
+    def test_capacite_et_disponibilite(self):
+        generateur = random.Random(5)
+        depot = generer_depot(400)
+        moteur = MoteurRequetes(depot)
+        for rang in range(40):
+            depot.ajouter_vehicule(Camion("Iveco", "Daily", f"I{rang}", generateur.choice((1.0, 7.5))) if generateur.random() < 0.5 else Moto("Honda", "PCX", f"H{rang}", 125))
+            if rang % 10 == 5:
+                depot.equiper_livreurs()
+            obtenus = moteur.requete_vehicules().capacite_entre(100, 2000).disponibles().vehicules()
+            attendus = [vehicule for vehicule in depot.vehicules_disponibles if 100 <= vehicule.charge_maximale() <= 2000]
+            self.assertCountEqual(obtenus, attendus)
+            self.assertEqual([vehicule.charge_maximale() for vehicule in obtenus], sorted(vehicule.charge_maximale() for vehicule in attendus))
+        moteur.fermer()
+
+if __name__ == "__main__":
+    unittest.main()
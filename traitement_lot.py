@@ -0,0 +1,72 @@
+import argparse
+import os
+import sys
+
+from livraison import Depot, Repartiteur
+from importation import ImportateurDepot
+from instrumentation import Instrumentation
+from persistance import JournalDepot
+
+def construire_parseur():
+    parseur = argparse.ArgumentParser(description="Traitement par lot du dépôt: import, répartition, livraison et rapport, sans interface graphique.")
+    parseur.add_argument("commandes", help="fichier CSV ou JSONL des commandes à importer")
+    parseur.add_argument("--vehicules", help="fichier CSV ou JSONL des véhicules à importer")
+    parseur.add_argument("--livreurs", help="fichier CSV ou JSONL des livreurs à importer")
+    parseur.add_argument("--donnees", help="dossier de persistance du dépôt (journal et instantané)")
+    parseur.add_argument("--rapport", help="fichier où écrire le rapport détaillé des livraisons")
+    parseur.add_argument("--taille-lot", type=int, default=10000, help="nombre de lignes importées par lot")
+    parseur.add_argument("--gazetteer", help="fichier CSV (destination, latitude, longitude) servant à ordonner chaque tournée avant livraison")
+    parseur.add_argument("--metriques", help="fichier où exporter les histogrammes de latence des opérations du dépôt")
+    parseur.add_argument("--profil-lent", type=float, metavar="SECONDES", help="échantillonner les piles des opérations plus lentes que ce seuil")
+    return parseur
+
+def main(argv=None):
+    arguments = construire_parseur().parse_args(argv)
+    journal = None
+    instrumentation = None
+    if arguments.metriques or arguments.profil_lent is not None:
+        instrumentation = Instrumentation(arguments.metriques)
+        instrumentation.instrumenter_noyau()
+        if arguments.profil_lent is not None:
+            instrumentation.profiler(os.path.dirname(os.path.abspath(arguments.metriques)) if arguments.metriques else os.getcwd(), arguments.profil_lent)
+    try:
+        if arguments.donnees:
+            journal = JournalDepot(arguments.donnees)
+            depot = journal.charger()
+        else:
+            depot = Depot()
+        if arguments.gazetteer:
+            from itineraires import Gazetteer, OptimiseurTournees
+            depot.optimiseur = OptimiseurTournees(Gazetteer.depuis_fichier(arguments.gazetteer))
+
+        importateur = ImportateurDepot(depot, arguments.taille_lot)
+        for genre, chemin in (("vehicules", arguments.vehicules), ("livreurs", arguments.livreurs), ("commandes", arguments.commandes)):
+            if chemin:
+                print(f"Import des {genre} ({chemin}):")
+                print(importateur.importer(chemin, genre, chemin + ".rejets.jsonl"))
+
+        depot.equiper_livreurs()
+        print(Repartiteur(depot).repartir())
+
+        rapports = depot.effectuer_livraisons()
+        livrees = sum(rapport.nombre_livrees() for rapport in rapports)
+        echecs = sum(len(rapport.resultats) for rapport in rapports) - livrees
+        print(f"{len(rapports)} tournée(s) effectuée(s): {livrees} commande(s) livrée(s), {echecs} échec(s).")
+        if arguments.rapport:
+            with open(arguments.rapport, "w", encoding="utf-8") as fichier:
+                for rapport in rapports:
+                    fichier.writelines(ligne + "\n" for ligne in rapport.lignes())
+    except (OSError, ValueError) as e:
+        print(f"Erreur: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if journal is not None and journal.depot is not None:
+            journal.compacter()
+            journal.fermer()
+        if instrumentation is not None:
+            print(instrumentation.resume())
+            instrumentation.fermer()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())